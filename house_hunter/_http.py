@@ -0,0 +1,41 @@
+"""Process-wide httpx connection pool shared by the OpenAI async clients."""
+
+import importlib.util
+import logging
+import threading
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 keep-alive
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_lock = threading.Lock()
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Shared AsyncClient so TLS handshakes to api.openai.com are paid once, not per agent.
+    Pooled connections belong to the event loop that opened them - close the client
+    (aclose_http_client) before that loop goes away; the next call builds a fresh one.
+    """
+    global _client
+    with _lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=30.0,
+            )
+            logger.debug(f"Created shared HTTP client (http2={HTTP2_AVAILABLE})")
+        return _client
+
+
+async def aclose_http_client():
+    global _client
+    with _lock:
+        client, _client = _client, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
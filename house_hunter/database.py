@@ -3,20 +3,258 @@
 import json
 import logging
 import sqlite3
+import threading
+import zlib
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# SQLite 3.45+ can store JSON as pre-parsed JSONB blobs; older builds keep plain text
+JSONB_SUPPORTED = sqlite3.sqlite_version_info >= (3, 45, 0)
+_JSON_IN = "jsonb(?)" if JSONB_SUPPORTED else "?"
+
+
+def _json_out(column: str, prefix: str = "") -> str:
+    """Select expression that hands a JSON column back to Python as text."""
+    if JSONB_SUPPORTED:
+        return f"json({prefix}{column}) as {column}"
+    return f"{prefix}{column}"
+
+
+def _seen_columns(prefix: str = "") -> str:
+    return ", ".join([
+        *(f"{prefix}{c}" for c in (
+            "property_id", "address", "city", "state", "zip_code",
+            "price", "beds", "baths", "sqft", "year_built",
+            "first_seen", "last_seen", "notified_at", "review_passes", "listing_url",
+        )),
+        _json_out("review_result", prefix),
+        f"{prefix}raw_data",
+    ])
+
+
+# raw_data payloads are multi-KB and very repetitive, so big ones are stored
+# zlib-compressed. The first byte tags the encoding.
+RAW_DATA_COMPRESS_THRESHOLD = 512
+_RAW_PLAIN = b"j"
+_RAW_ZLIB = b"z"
+
+
+def _encode_raw_data(raw_data: Any) -> bytes:
+    encoded = json.dumps(raw_data).encode("utf-8")
+    if len(encoded) < RAW_DATA_COMPRESS_THRESHOLD:
+        return _RAW_PLAIN + encoded
+    return _RAW_ZLIB + zlib.compress(encoded, 6)
+
+
+def _as_dict(record: Any) -> dict[str, Any]:
+    """PropertyData/ReviewResult are dataclasses; DB rows and older callers pass plain dicts."""
+    return record if isinstance(record, dict) else record.to_dict()
+
+
+def _raw_data_for(property_data: dict[str, Any]) -> Any:
+    """
+    Listing payload to archive. PropertyData only carries raw_data_path (the scraper's
+    cached detail response, stored as {"ts", "body"}); read it lazily here.
+    """
+    if "raw_data" in property_data:
+        return property_data["raw_data"]
+    path = property_data.get("raw_data_path")
+    if not path:
+        return {}
+    try:
+        return json.loads(Path(path).read_bytes()).get("body", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _seen_row(property_data: dict[str, Any], review_result: dict[str, Any] | None = None) -> tuple:
+    """
+    SQL_UPSERT_SEEN parameters for one property. Reads and compresses the cached
+    raw data, so build these before taking the write lock.
+    """
+    return (
+        property_data.get("property_id"),
+        property_data.get("address"),
+        property_data.get("city"),
+        property_data.get("state"),
+        property_data.get("zip_code"),
+        property_data.get("price"),
+        property_data.get("beds"),
+        property_data.get("baths"),
+        property_data.get("sqft"),
+        property_data.get("year_built"),
+        json.dumps(_as_dict(review_result)) if review_result else None,
+        review_result.get("passes") if review_result else None,
+        property_data.get("listing_url"),
+        _encode_raw_data(_raw_data_for(property_data))
+    )
+
+
+def _decode_raw_data(value: bytes | str | None) -> Any:
+    if not value:
+        return value
+    if isinstance(value, str):
+        # Rows written before raw_data was compressed
+        return json.loads(value)
+    tag, body = value[:1], value[1:]
+    if tag == _RAW_ZLIB:
+        body = zlib.decompress(body)
+    return json.loads(body)
+
+
+# Hot-path statements, kept as constants so every call hits sqlite3's statement cache
+SQL_IS_SEEN = "SELECT 1 FROM seen_properties WHERE property_id = ? LIMIT 1"
+SQL_IS_NOTIFIED = "SELECT 1 FROM seen_properties WHERE property_id = ? AND notified_at IS NOT NULL LIMIT 1"
+SQL_NOTIFIED_IDS = "SELECT property_id FROM seen_properties WHERE notified_at IS NOT NULL"
+# Properties per SQL_NOTIFICATION_AND_INSIGHTS query; two bound parameters each,
+# under the 999 limit of older SQLite builds
+NOTIFICATION_LOOKUP_CHUNK = 400
+# recorded_at has one-second resolution; a second sighting within the same second
+# just overwrites the price point instead of violating the (property_id, recorded_at) key.
+# RETURNING hands back the previous price in the same statement. The subquery sees the
+# row being inserted, so it skips anything stamped with this statement's CURRENT_TIMESTAMP.
+SQL_INSERT_PRICE = """
+    INSERT OR REPLACE INTO price_history (property_id, price) VALUES (?1, ?2)
+    RETURNING (
+        SELECT price FROM price_history
+        WHERE property_id = ?1 AND recorded_at < CURRENT_TIMESTAMP
+        ORDER BY recorded_at DESC LIMIT 1
+    ) as old_price
+"""
+SQL_UPSERT_SEEN = f"""
+    INSERT INTO seen_properties (
+        property_id, address, city, state, zip_code,
+        price, beds, baths, sqft, year_built,
+        review_result, review_passes, listing_url, raw_data
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {_JSON_IN}, ?, ?, ?)
+    ON CONFLICT(property_id) DO UPDATE SET
+        last_seen = CURRENT_TIMESTAMP,
+        price = excluded.price,
+        review_result = COALESCE(excluded.review_result, review_result),
+        review_passes = COALESCE(excluded.review_passes, review_passes)
+"""
+SQL_MARK_NOTIFIED = "UPDATE seen_properties SET notified_at = CURRENT_TIMESTAMP WHERE property_id = ?"
+SQL_INSERT_NOTIFICATION = (
+    "INSERT INTO notification_history (property_id, notification_type, success, error_message) VALUES (?, ?, ?, ?)"
+)
+# rn=1 is the latest price, rn=2 the one before it - one pass over price_history
+# instead of a self-join with correlated MAX() subqueries
+_PRICE_DROPS_CTE = """
+    WITH ranked AS (
+        SELECT
+            property_id, price, recorded_at,
+            ROW_NUMBER() OVER (PARTITION BY property_id ORDER BY recorded_at DESC) as rn
+        FROM price_history
+    ),
+    drops AS (
+        SELECT
+            p2.property_id,
+            p1.price as old_price,
+            p2.price as new_price,
+            (p1.price - p2.price) as drop_amount,
+            ((p1.price - p2.price) * 100.0 / p1.price) as drop_percent,
+            p2.recorded_at as price_drop_date
+        FROM ranked p2
+        INNER JOIN ranked p1 ON p1.property_id = p2.property_id AND p1.rn = 2
+        WHERE p2.rn = 1
+          AND p2.price < p1.price
+          AND ((p1.price - p2.price) * 100.0 / p1.price) >= ?
+          AND p2.recorded_at >= datetime('now', '-7 days')
+    )
+"""
+# Only the columns the price-drop alert and its market insights read
+SQL_PRICE_DROPS = f"""{_PRICE_DROPS_CTE}
+    SELECT
+        sp.property_id, sp.address, sp.city, sp.price, sp.beds, sp.baths, sp.sqft, sp.listing_url,
+        d.old_price, d.new_price, d.drop_amount, d.drop_percent, d.price_drop_date
+    FROM drops d
+    INNER JOIN seen_properties sp ON sp.property_id = d.property_id
+    WHERE ? = 0 OR sp.notified_at IS NULL
+    ORDER BY d.drop_percent DESC
+"""
+# All the headline counts in one scan of seen_properties, plus the price drop count
+SQL_STATISTICS = f"""{_PRICE_DROPS_CTE}
+    SELECT
+        COUNT(*) as total_properties,
+        COUNT(CASE WHEN notified_at IS NOT NULL THEN 1 END) as properties_notified,
+        COUNT(CASE WHEN review_passes = 1 THEN 1 END) as properties_passed,
+        COUNT(CASE WHEN first_seen >= datetime('now', '-7 days') THEN 1 END) as last_7_days,
+        (
+            SELECT COUNT(*) FROM drops d
+            INNER JOIN seen_properties sp ON sp.property_id = d.property_id
+        ) as price_drops_last_7_days
+    FROM seen_properties
+"""
+# LIMIT -1 means no limit in SQLite
+SQL_BY_CITY = "SELECT city, COUNT(*) as count FROM seen_properties GROUP BY city ORDER BY count DESC LIMIT ?"
+SQL_CLEANUP_UNNOTIFIED = (
+    "DELETE FROM seen_properties WHERE first_seen < datetime('now', ? || ' days') AND notified_at IS NULL"
+)
+SQL_CLEANUP_REVIEW_CACHE = (
+    "DELETE FROM llm_review_cache WHERE created_at < CAST(strftime('%s', 'now', ? || ' days') AS INTEGER)"
+)
+SQL_GET_CACHED_REVIEW = "SELECT result_json FROM llm_review_cache WHERE fp = ?"
+SQL_PUT_CACHED_REVIEW = (
+    "INSERT OR REPLACE INTO llm_review_cache (fp, result_json, created_at) "
+    "VALUES (?, ?, CAST(strftime('%s', 'now') AS INTEGER))"
+)
+SQL_DAYS_ON_MARKET = """
+    SELECT CAST(JULIANDAY('now') - JULIANDAY(first_seen) AS INTEGER) as days
+    FROM seen_properties WHERE property_id = ?
+"""
+SQL_CITY_STATS = """
+    SELECT
+        AVG(CASE WHEN price > 0 THEN price END) as avg_price,
+        COUNT(CASE WHEN price > 0 THEN 1 END) as count,
+        AVG(CASE WHEN sqft > 0 AND price > 0 THEN price * 1.0 / sqft END) as avg_price_per_sqft,
+        AVG(JULIANDAY('now') - JULIANDAY(first_seen)) as avg_days
+    FROM seen_properties WHERE city = ?
+"""
+# Notified flag, days on market and the city aggregates for a batch of (property_id, city)
+# rows in one statement; {rows} is one "(?, ?)" per property. Cities are only aggregated
+# once each, and only for properties that still need a notification.
+SQL_NOTIFICATION_AND_INSIGHTS = """
+    WITH ids(property_id, city) AS (VALUES {rows}),
+    status AS (
+        SELECT
+            i.property_id,
+            i.city,
+            sp.notified_at IS NOT NULL as notified,
+            CAST(JULIANDAY('now') - JULIANDAY(sp.first_seen) AS INTEGER) as days
+        FROM ids i
+        LEFT JOIN seen_properties sp ON sp.property_id = i.property_id
+    ),
+    city_stats AS (
+        SELECT
+            city,
+            AVG(CASE WHEN price > 0 THEN price END) as avg_price,
+            COUNT(CASE WHEN price > 0 THEN 1 END) as count,
+            AVG(CASE WHEN sqft > 0 AND price > 0 THEN price * 1.0 / sqft END) as avg_price_per_sqft,
+            AVG(JULIANDAY('now') - JULIANDAY(first_seen)) as avg_days
+        FROM seen_properties
+        WHERE city IN (SELECT city FROM status WHERE NOT notified)
+        GROUP BY city
+    )
+    SELECT s.property_id, s.notified, s.days, c.avg_price, c.count, c.avg_price_per_sqft, c.avg_days
+    FROM status s
+    LEFT JOIN city_stats c ON c.city = s.city
+"""
+
+
+def _default_db_path() -> Path:
+    project_root = Path(__file__).parent.parent
+    data_dir = project_root / "data"
+    data_dir.mkdir(exist_ok=True)
+    return data_dir / "house_hunter.db"
+
 
 class PropertyDatabase:
 
     def __init__(self, db_path: str = None):
         if db_path is None:
-            project_root = Path(__file__).parent.parent
-            data_dir = project_root / "data"
-            data_dir.mkdir(exist_ok=True)
-            db_path = data_dir / "house_hunter.db"
+            db_path = _default_db_path()
 
         self.db_path = str(db_path)
         self.conn = None
@@ -25,21 +263,49 @@ class PropertyDatabase:
 
     def _connect(self):
         try:
-            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # isolation_level=None: no implicit BEGIN around DML (or reads) - writes
+            # open their own BEGIN IMMEDIATE via _begin() so batches are explicit
+            self.conn = sqlite3.connect(
+                self.db_path, isolation_level=None, check_same_thread=False, cached_statements=256
+            )
             self.conn.row_factory = sqlite3.Row
+
+            # WAL + NORMAL sync: one fsync per checkpoint instead of per commit,
+            # and readers don't block on the writer
+            cursor = self.conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            journal_mode = cursor.fetchone()[0]
+            if journal_mode.lower() != "wal":
+                logger.warning(f"Could not enable WAL mode, using: {journal_mode}")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-65536")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.execute("PRAGMA wal_autocheckpoint=1000")
+
             logger.info(f"Connected to database: {self.db_path}")
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
 
+    def _begin(self):
+        # IMMEDIATE takes the write lock up front, so a concurrent writer fails
+        # fast with SQLITE_BUSY instead of deadlocking on lock upgrade
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    def _commit(self):
+        self.conn.execute("COMMIT")
+
     def _create_tables(self):
         try:
+            self._begin()
             cursor = self.conn.cursor()
 
+            # Both tables are keyed lookups by property_id, so they're clustered on
+            # it directly (WITHOUT ROWID) instead of index -> rowid -> table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS seen_properties (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    property_id TEXT UNIQUE NOT NULL,
+                    property_id TEXT PRIMARY KEY,
                     address TEXT NOT NULL,
                     city TEXT,
                     state TEXT,
@@ -52,11 +318,11 @@ class PropertyDatabase:
                     first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     notified_at TIMESTAMP,
-                    review_result TEXT,
+                    review_result BLOB,
                     review_passes BOOLEAN,
                     listing_url TEXT,
-                    raw_data TEXT
-                )
+                    raw_data BLOB
+                ) WITHOUT ROWID
             """)
 
             cursor.execute("""
@@ -73,167 +339,204 @@ class PropertyDatabase:
 
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS price_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
                     property_id TEXT NOT NULL,
                     price INTEGER NOT NULL,
                     recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (property_id, recorded_at),
                     FOREIGN KEY (property_id) REFERENCES seen_properties(property_id)
+                ) WITHOUT ROWID
+            """)
+
+            # LLM verdicts keyed by a fingerprint of the reviewed fields + criteria
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS llm_review_cache (
+                    fp TEXT PRIMARY KEY,
+                    result_json TEXT NOT NULL,
+                    created_at INTEGER NOT NULL
                 )
             """)
 
             # Indexes
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_property_id ON seen_properties(property_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_notified_at ON seen_properties(notified_at)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_city ON seen_properties(city)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_price_history_property ON price_history(property_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_price_history_recorded ON price_history(recorded_at)")
 
-            self.conn.commit()
+            self._commit()
             logger.info("Database tables created/verified")
 
         except Exception as e:
             logger.error(f"Failed to create tables: {e}")
+            self.conn.rollback()
             raise
 
     def is_property_seen(self, property_id: str) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT id FROM seen_properties WHERE property_id = ?", (property_id,))
-            return cursor.fetchone() is not None
+            return self.conn.execute(SQL_IS_SEEN, (property_id,)).fetchone() is not None
         except Exception as e:
             logger.error(f"Error checking if property seen: {e}")
             return False
 
     def is_property_notified(self, property_id: str) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "SELECT notified_at FROM seen_properties WHERE property_id = ? AND notified_at IS NOT NULL",
-                (property_id,)
-            )
-            return cursor.fetchone() is not None
+            return self.conn.execute(SQL_IS_NOTIFIED, (property_id,)).fetchone() is not None
         except Exception as e:
             logger.error(f"Error checking if property notified: {e}")
             return False
 
+    def get_notified_ids(self) -> set[str]:
+        """All notified property ids, for O(1) membership checks in loops."""
+        try:
+            return {row[0] for row in self.conn.execute(SQL_NOTIFIED_IDS)}
+        except Exception as e:
+            logger.error(f"Error getting notified ids: {e}")
+            return set()
+
+    def get_notification_and_insights(self, property_id: str, property_data: dict[str, Any]) -> tuple[bool, dict[str, Any]]:
+        """(already notified?, market insights) for one property; see get_notifications_and_insights."""
+        return self.get_notifications_and_insights([property_data]).get(property_id, (False, {}))
+
+    def get_notifications_and_insights(self, properties: list[dict[str, Any]]) -> dict[str, tuple[bool, dict[str, Any]]]:
+        """
+        property_id -> (already notified?, market insights), from one
+        SQL_NOTIFICATION_AND_INSIGHTS query per NOTIFICATION_LOOKUP_CHUNK properties
+        instead of a notified check plus two insight queries each. Insights are {} for
+        notified properties. Ids missing from the result could not be looked up.
+        """
+        by_id = {p.get("property_id"): p for p in properties}
+        props = list(by_id.values())
+        lookups = {}
+        try:
+            for start in range(0, len(props), NOTIFICATION_LOOKUP_CHUNK):
+                chunk = props[start:start + NOTIFICATION_LOOKUP_CHUNK]
+                query = SQL_NOTIFICATION_AND_INSIGHTS.format(rows=",".join(["(?, ?)"] * len(chunk)))
+                # Without a price the insights are empty anyway; skip that city's aggregates
+                params = [v for p in chunk for v in (p.get("property_id"), p.get("city") if p.get("price") else None)]
+                for row in self.conn.execute(query, params):
+                    if row["notified"]:
+                        lookups[row["property_id"]] = (True, {})
+                        continue
+                    city_stats = {k: row[k] for k in ("avg_price", "count", "avg_price_per_sqft", "avg_days")}
+                    lookups[row["property_id"]] = (
+                        False, self._build_insights(by_id[row["property_id"]], row["days"], city_stats)
+                    )
+            return lookups
+        except Exception as e:
+            logger.error(f"Error checking notifications and insights: {e}")
+            return lookups
+
     def track_price_change(self, property_id: str, new_price: int) -> dict[str, Any] | None:
         """Returns price drop info if price went down, None otherwise."""
         try:
-            cursor = self.conn.cursor()
-
-            cursor.execute(
-                "SELECT price FROM price_history WHERE property_id = ? ORDER BY recorded_at DESC LIMIT 1",
-                (property_id,)
-            )
-            result = cursor.fetchone()
-
-            cursor.execute("INSERT INTO price_history (property_id, price) VALUES (?, ?)", (property_id, new_price))
-            self.conn.commit()
-
-            if result:
-                old_price = result[0]
-                if new_price < old_price:
-                    drop_amount = old_price - new_price
-                    drop_percent = (drop_amount / old_price) * 100
-                    logger.info(f"Price drop detected for {property_id}: ${old_price:,} -> ${new_price:,} (-${drop_amount:,}, -{drop_percent:.1f}%)")
-                    return {
-                        "old_price": old_price,
-                        "new_price": new_price,
-                        "drop_amount": drop_amount,
-                        "drop_percent": drop_percent
-                    }
-
-            return None
+            self._begin()
+            drop = self._track_price_change_no_commit(property_id, new_price)
+            self._commit()
+            return drop
 
         except Exception as e:
             logger.error(f"Error tracking price change: {e}")
+            self.conn.rollback()
             return None
 
-    def mark_property_seen(self, property_data: dict[str, Any], review_result: dict[str, Any] | None = None):
-        try:
-            cursor = self.conn.cursor()
+    def _track_price_change_no_commit(self, property_id: str, new_price: int) -> dict[str, Any] | None:
+        """Record a price point without committing, so callers can batch writes."""
+        old_price = self.conn.execute(SQL_INSERT_PRICE, (property_id, new_price)).fetchone()[0]
 
-            price = property_data.get("price")
-            if price:
-                self.track_price_change(property_data.get("property_id"), price)
+        if old_price is not None:
+            if new_price < old_price:
+                drop_amount = old_price - new_price
+                drop_percent = (drop_amount / old_price) * 100
+                logger.info(f"Price drop detected for {property_id}: ${old_price:,} -> ${new_price:,} (-${drop_amount:,}, -{drop_percent:.1f}%)")
+                return {
+                    "old_price": old_price,
+                    "new_price": new_price,
+                    "drop_amount": drop_amount,
+                    "drop_percent": drop_percent
+                }
 
-            if self.is_property_seen(property_data.get("property_id")):
-                cursor.execute(
-                    "UPDATE seen_properties SET last_seen = CURRENT_TIMESTAMP, price = ? WHERE property_id = ?",
-                    (price, property_data.get("property_id"))
-                )
-            else:
-                cursor.execute(
-                    """
-                    INSERT INTO seen_properties (
-                        property_id, address, city, state, zip_code,
-                        price, beds, baths, sqft, year_built,
-                        review_result, review_passes, listing_url, raw_data
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        property_data.get("property_id"),
-                        property_data.get("address"),
-                        property_data.get("city"),
-                        property_data.get("state"),
-                        property_data.get("zip_code"),
-                        property_data.get("price"),
-                        property_data.get("beds"),
-                        property_data.get("baths"),
-                        property_data.get("sqft"),
-                        property_data.get("year_built"),
-                        json.dumps(review_result) if review_result else None,
-                        review_result.get("passes") if review_result else None,
-                        property_data.get("listing_url"),
-                        json.dumps(property_data.get("raw_data", {}))
-                    )
-                )
+        return None
 
-            self.conn.commit()
+    def mark_property_seen(self, property_data: dict[str, Any], review_result: dict[str, Any] | None = None):
+        try:
+            row = _seen_row(property_data, review_result)
+            self._begin()
+            self._mark_rows_seen_no_commit([row])
+            self._commit()
             logger.info(f"Marked property as seen: {property_data.get('property_id')}")
 
         except Exception as e:
             logger.error(f"Error marking property as seen: {e}")
             self.conn.rollback()
 
-    def mark_property_notified(self, property_id: str, success: bool = True, error_message: str = None):
+    def bulk_mark_seen(self, properties: list[dict[str, Any]], reviews: list[dict[str, Any]] | None = None):
+        """
+        Mark a whole batch as seen in one transaction (one fsync instead of 2+
+        per property). `reviews`, if given, is matched to properties by property_id.
+        """
+        if not properties:
+            return
+
+        review_map = {r["property_id"]: r for r in reviews} if reviews else {}
+
         try:
-            cursor = self.conn.cursor()
+            # File reads and compression happen before BEGIN IMMEDIATE, not under the write lock
+            rows = [_seen_row(prop, review_map.get(prop.get("property_id"))) for prop in properties]
+            self._begin()
+            self._mark_rows_seen_no_commit(rows)
+            self._commit()
+            logger.info(f"Marked {len(properties)} properties as seen")
 
-            cursor.execute(
-                "UPDATE seen_properties SET notified_at = CURRENT_TIMESTAMP WHERE property_id = ?",
-                (property_id,)
-            )
+        except Exception as e:
+            logger.error(f"Error bulk marking properties as seen: {e}")
+            self.conn.rollback()
 
-            cursor.execute(
-                "INSERT INTO notification_history (property_id, notification_type, success, error_message) VALUES (?, ?, ?, ?)",
-                (property_id, "telegram", success, error_message)
-            )
+    def _mark_rows_seen_no_commit(self, rows: list[tuple]):
+        """Price points plus seen upserts for prebuilt _seen_row tuples; the caller commits."""
+        for row in rows:
+            if row[5]:  # price
+                self._track_price_change_no_commit(row[0], row[5])
 
-            self.conn.commit()
+        # property_id is UNIQUE, so a repeat sighting just bumps last_seen/price
+        self.conn.executemany(SQL_UPSERT_SEEN, rows)
+
+    def mark_property_notified(self, property_id: str, success: bool = True, error_message: str = None):
+        try:
+            self._begin()
+            self.conn.execute(SQL_MARK_NOTIFIED, (property_id,))
+            self.conn.execute(SQL_INSERT_NOTIFICATION, (property_id, "telegram", success, error_message))
+            self._commit()
             logger.info(f"Marked property as notified: {property_id}")
 
         except Exception as e:
             logger.error(f"Error marking property as notified: {e}")
             self.conn.rollback()
 
-    def get_recent_properties(self, days: int = 7, only_notified: bool = False) -> list[dict[str, Any]]:
+    def mark_many_notified(self, property_ids: list[str], success: bool = True):
+        """mark_property_notified for a batch, in one transaction."""
+        if not property_ids:
+            return
+
         try:
-            cursor = self.conn.cursor()
+            self._begin()
+            self.conn.executemany(SQL_MARK_NOTIFIED, [(pid,) for pid in property_ids])
+            self.conn.executemany(SQL_INSERT_NOTIFICATION, [(pid, "telegram", success, None) for pid in property_ids])
+            self._commit()
+            logger.info(f"Marked {len(property_ids)} properties as notified")
 
-            query = f"SELECT * FROM seen_properties WHERE first_seen >= datetime('now', '-{days} days')"
+        except Exception as e:
+            logger.error(f"Error marking properties as notified: {e}")
+            self.conn.rollback()
+
+    def get_recent_properties(self, days: int = 7, only_notified: bool = False) -> list[dict[str, Any]]:
+        try:
+            query = f"SELECT {_seen_columns()} FROM seen_properties WHERE first_seen >= datetime('now', ? || ' days')"
             if only_notified:
                 query += " AND notified_at IS NOT NULL"
             query += " ORDER BY first_seen DESC"
 
-            cursor.execute(query)
-            rows = cursor.fetchall()
-
             properties = []
-            for row in rows:
+            for row in self.conn.execute(query, (f"-{int(days)}",)):
                 prop_dict = dict(row)
                 if prop_dict.get("raw_data"):
-                    prop_dict["raw_data"] = json.loads(prop_dict["raw_data"])
+                    prop_dict["raw_data"] = _decode_raw_data(prop_dict["raw_data"])
                 if prop_dict.get("review_result"):
                     prop_dict["review_result"] = json.loads(prop_dict["review_result"])
                 properties.append(prop_dict)
@@ -244,168 +547,139 @@ class PropertyDatabase:
             logger.error(f"Error getting recent properties: {e}")
             return []
 
-    def get_properties_with_price_drops(self, min_drop_percent: float = 2.0) -> list[dict[str, Any]]:
-        """Find properties where the latest price is lower than the previous one."""
+    def get_properties_with_price_drops(self, min_drop_percent: float = 2.0, unnotified_only: bool = False) -> list[dict[str, Any]]:
+        """
+        Find properties where the latest price is lower than the previous one.
+        With `unnotified_only`, already-notified properties are filtered out in SQL.
+        """
         try:
-            cursor = self.conn.cursor()
-
-            cursor.execute("""
-                SELECT
-                    sp.*,
-                    ph1.price as old_price,
-                    ph2.price as new_price,
-                    (ph1.price - ph2.price) as drop_amount,
-                    ((ph1.price - ph2.price) * 100.0 / ph1.price) as drop_percent,
-                    ph2.recorded_at as price_drop_date
-                FROM seen_properties sp
-                INNER JOIN price_history ph1 ON sp.property_id = ph1.property_id
-                INNER JOIN price_history ph2 ON sp.property_id = ph2.property_id
-                WHERE ph2.recorded_at > ph1.recorded_at
-                  AND ph2.price < ph1.price
-                  AND ((ph1.price - ph2.price) * 100.0 / ph1.price) >= ?
-                  AND ph2.recorded_at >= datetime('now', '-7 days')
-                GROUP BY sp.property_id
-                HAVING ph1.recorded_at = (
-                    SELECT MAX(recorded_at) FROM price_history
-                    WHERE property_id = sp.property_id AND recorded_at < ph2.recorded_at
-                )
-                AND ph2.recorded_at = (
-                    SELECT MAX(recorded_at) FROM price_history
-                    WHERE property_id = sp.property_id
-                )
-                ORDER BY drop_percent DESC
-            """, (min_drop_percent,))
-
-            rows = cursor.fetchall()
-            properties = []
-            for row in rows:
-                prop_dict = dict(row)
-                if prop_dict.get("raw_data"):
-                    prop_dict["raw_data"] = json.loads(prop_dict["raw_data"])
-                properties.append(prop_dict)
-
-            return properties
+            rows = self.conn.execute(SQL_PRICE_DROPS, (min_drop_percent, unnotified_only))
+            return [dict(row) for row in rows]
 
         except Exception as e:
             logger.error(f"Error getting properties with price drops: {e}")
             return []
 
+    def get_cached_review(self, fingerprint: str) -> dict[str, Any] | None:
+        try:
+            row = self.conn.execute(SQL_GET_CACHED_REVIEW, (fingerprint,)).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            logger.error(f"Error reading review cache: {e}")
+            return None
+
+    def cache_review(self, fingerprint: str, result: dict[str, Any]):
+        try:
+            self._begin()
+            self.conn.execute(SQL_PUT_CACHED_REVIEW, (fingerprint, json.dumps(result)))
+            self._commit()
+        except Exception as e:
+            logger.error(f"Error writing review cache: {e}")
+            self.conn.rollback()
+
     def get_days_on_market(self, property_id: str) -> int | None:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT CAST(JULIANDAY('now') - JULIANDAY(first_seen) AS INTEGER) as days
-                FROM seen_properties WHERE property_id = ?
-            """, (property_id,))
-            result = cursor.fetchone()
+            result = self.conn.execute(SQL_DAYS_ON_MARKET, (property_id,)).fetchone()
             return result[0] if result else None
         except Exception as e:
             logger.error(f"Error calculating days on market: {e}")
             return None
 
-    def get_market_insights(self, property_data: dict[str, Any]) -> dict[str, Any]:
-        """Compare a property against city averages (price, $/sqft, days on market)."""
+    def get_city_stats(self, city: str) -> dict[str, Any]:
+        """Price, $/sqft and days-on-market averages for one city in a single pass."""
+        try:
+            row = self.conn.execute(SQL_CITY_STATS, (city,)).fetchone()
+            return dict(row) if row else {}
+        except Exception as e:
+            logger.error(f"Error getting city stats: {e}")
+            return {}
+
+    def get_market_insights(self, property_data: dict[str, Any], city_stats: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Compare a property against city averages (price, $/sqft, days on market).
+        Pass `city_stats` from get_city_stats() to reuse aggregates across properties.
+        """
         try:
-            cursor = self.conn.cursor()
             city = property_data.get("city")
-            price = property_data.get("price")
-            sqft = property_data.get("sqft")
             property_id = property_data.get("property_id")
 
-            insights = {}
-
-            if not city:
-                return insights
-
-            if property_id:
-                days = self.get_days_on_market(property_id)
-                if days is not None:
-                    insights["days_on_market"] = days
-
-            # Average price in city
-            cursor.execute(
-                "SELECT AVG(price) as avg_price, COUNT(*) as count FROM seen_properties WHERE city = ? AND price > 0",
-                (city,)
-            )
-            result = cursor.fetchone()
-            if result and result[0]:
-                avg_price = result[0]
-                count = result[1]
-                insights["city_avg_price"] = int(avg_price)
-                insights["city_property_count"] = count
-
-                if price:
-                    diff = price - avg_price
-                    diff_percent = (diff / avg_price) * 100
-                    insights["price_vs_avg"] = diff
-                    insights["price_vs_avg_percent"] = diff_percent
-
-            # Price per sqft
-            if sqft and sqft > 0:
-                cursor.execute(
-                    "SELECT AVG(price * 1.0 / sqft) as avg_price_per_sqft FROM seen_properties WHERE city = ? AND sqft > 0 AND price > 0",
-                    (city,)
-                )
-                result = cursor.fetchone()
-                if result and result[0]:
-                    avg_price_per_sqft = result[0]
-                    property_price_per_sqft = price / sqft if price else 0
-                    insights["city_avg_price_per_sqft"] = round(avg_price_per_sqft, 2)
-                    insights["property_price_per_sqft"] = round(property_price_per_sqft, 2)
-
-                    if property_price_per_sqft > 0:
-                        diff_per_sqft = property_price_per_sqft - avg_price_per_sqft
-                        insights["price_per_sqft_vs_avg"] = round(diff_per_sqft, 2)
-
-            # Avg days on market in city
-            cursor.execute(
-                "SELECT AVG(JULIANDAY('now') - JULIANDAY(first_seen)) as avg_days FROM seen_properties WHERE city = ?",
-                (city,)
-            )
-            result = cursor.fetchone()
-            if result and result[0]:
-                avg_days_in_city = round(result[0], 1)
-                insights["city_avg_days_on_market"] = avg_days_in_city
-
-                if "days_on_market" in insights:
-                    property_days = insights["days_on_market"]
-                    if property_days < avg_days_in_city * 0.5:
-                        insights["staleness_vs_avg"] = "much_fresher"
-                    elif property_days < avg_days_in_city:
-                        insights["staleness_vs_avg"] = "fresher"
-                    elif property_days < avg_days_in_city * 1.5:
-                        insights["staleness_vs_avg"] = "average"
-                    else:
-                        insights["staleness_vs_avg"] = "stale"
+            # Nothing meaningful to compare without both; skip the queries entirely
+            if not city or not property_data.get("price"):
+                return {}
 
-            return insights
+            days = self.get_days_on_market(property_id) if property_id else None
+            if city_stats is None:
+                city_stats = self.get_city_stats(city)
+            return self._build_insights(property_data, days, city_stats)
 
         except Exception as e:
             logger.error(f"Error getting market insights: {e}")
             return {}
 
-    def get_statistics(self) -> dict[str, Any]:
-        try:
-            cursor = self.conn.cursor()
-            stats = {}
-
-            cursor.execute("SELECT COUNT(*) FROM seen_properties")
-            stats["total_properties"] = cursor.fetchone()[0]
+    @staticmethod
+    def _build_insights(property_data: dict[str, Any], days: int | None,
+                        city_stats: dict[str, Any]) -> dict[str, Any]:
+        """The insight dict for a property, given its days on market and its city's aggregates."""
+        price = property_data.get("price")
+        sqft = property_data.get("sqft")
 
-            cursor.execute("SELECT COUNT(*) FROM seen_properties WHERE notified_at IS NOT NULL")
-            stats["properties_notified"] = cursor.fetchone()[0]
+        insights = {}
+        if not property_data.get("city") or not price:
+            return insights
 
-            cursor.execute("SELECT COUNT(*) FROM seen_properties WHERE review_passes = 1")
-            stats["properties_passed"] = cursor.fetchone()[0]
+        if days is not None:
+            insights["days_on_market"] = days
 
-            cursor.execute("SELECT city, COUNT(*) as count FROM seen_properties GROUP BY city ORDER BY count DESC")
-            stats["by_city"] = {row[0]: row[1] for row in cursor.fetchall()}
+        # Average price in city
+        avg_price = city_stats.get("avg_price")
+        if avg_price:
+            insights["city_avg_price"] = int(avg_price)
+            insights["city_property_count"] = city_stats.get("count")
 
-            cursor.execute("SELECT COUNT(*) FROM seen_properties WHERE first_seen >= datetime('now', '-7 days')")
-            stats["last_7_days"] = cursor.fetchone()[0]
+            if price:
+                diff = price - avg_price
+                diff_percent = (diff / avg_price) * 100
+                insights["price_vs_avg"] = diff
+                insights["price_vs_avg_percent"] = diff_percent
+
+        # Price per sqft
+        avg_price_per_sqft = city_stats.get("avg_price_per_sqft")
+        if sqft and sqft > 0 and avg_price_per_sqft:
+            property_price_per_sqft = price / sqft if price else 0
+            insights["city_avg_price_per_sqft"] = round(avg_price_per_sqft, 2)
+            insights["property_price_per_sqft"] = round(property_price_per_sqft, 2)
+
+            if property_price_per_sqft > 0:
+                diff_per_sqft = property_price_per_sqft - avg_price_per_sqft
+                insights["price_per_sqft_vs_avg"] = round(diff_per_sqft, 2)
+
+        # Avg days on market in city
+        avg_days = city_stats.get("avg_days")
+        if avg_days:
+            avg_days_in_city = round(avg_days, 1)
+            insights["city_avg_days_on_market"] = avg_days_in_city
+
+            if "days_on_market" in insights:
+                property_days = insights["days_on_market"]
+                if property_days < avg_days_in_city * 0.5:
+                    insights["staleness_vs_avg"] = "much_fresher"
+                elif property_days < avg_days_in_city:
+                    insights["staleness_vs_avg"] = "fresher"
+                elif property_days < avg_days_in_city * 1.5:
+                    insights["staleness_vs_avg"] = "average"
+                else:
+                    insights["staleness_vs_avg"] = "stale"
+
+        return insights
+
+    def get_statistics(self, city_limit: int | None = None) -> dict[str, Any]:
+        """Headline counts and per-city totals (top `city_limit` cities, or all) in two queries."""
+        try:
+            # Price drops of at least 1% count towards the weekly figure
+            stats = dict(self.conn.execute(SQL_STATISTICS, (1.0,)).fetchone())
 
-            price_drops = self.get_properties_with_price_drops(min_drop_percent=1.0)
-            stats["price_drops_last_7_days"] = len(price_drops)
+            rows = self.conn.execute(SQL_BY_CITY, (-1 if city_limit is None else city_limit,))
+            stats["by_city"] = {row[0]: row[1] for row in rows}
 
             return stats
 
@@ -416,12 +690,10 @@ class PropertyDatabase:
     def cleanup_old_entries(self, days_to_keep: int = 90):
         """Remove old entries that were never notified."""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                f"DELETE FROM seen_properties WHERE first_seen < datetime('now', '-{days_to_keep} days') AND notified_at IS NULL"
-            )
-            deleted = cursor.rowcount
-            self.conn.commit()
+            self._begin()
+            deleted = self.conn.execute(SQL_CLEANUP_UNNOTIFIED, (f"-{int(days_to_keep)}",)).rowcount
+            self.conn.execute(SQL_CLEANUP_REVIEW_CACHE, (f"-{int(days_to_keep)}",))
+            self._commit()
             logger.info(f"Cleaned up {deleted} old entries")
             return deleted
         except Exception as e:
@@ -439,3 +711,21 @@ class PropertyDatabase:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+_shared: dict[str, PropertyDatabase] = {}
+_shared_lock = threading.Lock()
+
+
+def get_db(db_path: str = None) -> PropertyDatabase:
+    """
+    Process-wide PropertyDatabase per path. Agents and scheduled runs share one
+    connection, so connect + PRAGMAs + schema checks happen once per process.
+    """
+    key = str(db_path if db_path is not None else _default_db_path())
+    with _shared_lock:
+        db = _shared.get(key)
+        if db is None:
+            db = PropertyDatabase(key)
+            _shared[key] = db
+        return db
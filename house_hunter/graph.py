@@ -2,6 +2,7 @@
 
 import logging
 import os
+import re
 import uuid
 from datetime import datetime
 from typing import Any
@@ -9,14 +10,33 @@ from typing import Any
 from langgraph.graph import END, StateGraph
 from langsmith import traceable
 
-from .database import PropertyDatabase
+from .database import get_db
 from .reviewer import ReviewerAgent
 from .scraper_agent import ScraperAgent
-from .state import HouseHunterState
+from .state import HouseHunterState, PropertyData, ReviewResult
 from .summarizer import SummarizerAgent
 
 logger = logging.getLogger(__name__)
 
+# Rejection keyword -> score penalty for the closest-miss ranking, in priority
+# order: a reason only pays for the first keyword it contains.
+# "above maximum" is scaled by how far over budget the price is.
+_PENALTIES = {
+    "pool": 50,
+    "cleveland": 40,
+    "parma": 40,
+    "100 years old": 35,
+    "century": 35,
+    "unfinished basement": 25,
+    "not single-family": 30,
+    "above maximum": None,
+    "below minimum": 10,
+}
+_PENALTY_KEYWORDS = tuple(_PENALTIES)
+# One alternation scan per reason; group n is _PENALTY_KEYWORDS[n - 1], so the
+# smallest group number among the matches is the highest-priority keyword
+_PENALTY_RE = re.compile("|".join(f"({re.escape(k)})" for k in _PENALTY_KEYWORDS))
+
 
 class HouseHunterGraph:
     """Wires up scraper → reviewer → summarizer as a LangGraph workflow."""
@@ -25,15 +45,11 @@ class HouseHunterGraph:
         self.scraper = ScraperAgent()
         self.reviewer = ReviewerAgent()
         self.summarizer = SummarizerAgent()
-        self.database = PropertyDatabase()
+        self.database = get_db()
+        self.max_price = int(os.getenv("HOUSE_HUNTER_MAX_PRICE", "350000"))
 
-        # Clean up old entries on startup
-        try:
-            deleted = self.database.cleanup_old_entries(days_to_keep=90)
-            if deleted > 0:
-                logger.info(f"Database cleanup: removed {deleted} old entries")
-        except Exception as e:
-            logger.warning(f"Database cleanup failed: {e}")
+        # Per-city market aggregates, reset at the start of every run
+        self._city_stats: dict[str, dict[str, Any]] = {}
 
         self.workflow = self._build_graph()
         self.app = self.workflow.compile()
@@ -55,57 +71,51 @@ class HouseHunterGraph:
 
         return workflow
 
-    def _calculate_property_score(self, prop: dict, review: dict) -> float:
+    def _calculate_property_score(self, prop: PropertyData, review: ReviewResult) -> float:
         """
         Score rejected properties so we can find the "closest miss" to report.
         Starts at 100, deducts based on how bad each rejection reason is.
         """
         score = 100.0
 
-        reasons = review.get("reasons", [])
-        for reason in reasons:
-            reason_lower = reason.lower()
-
-            # Big dealbreakers
-            if "pool" in reason_lower:
-                score -= 50
-            elif "cleveland" in reason_lower or "parma" in reason_lower:
-                score -= 40
-            elif "100 years old" in reason_lower or "century" in reason_lower:
-                score -= 35
-            elif "unfinished basement" in reason_lower:
-                score -= 25
-            elif "not single-family" in reason_lower:
-                score -= 30
-            elif "above maximum" in reason_lower:
-                try:
-                    price = prop.get("price", 0)
-                    max_price = int(os.getenv("HOUSE_HUNTER_MAX_PRICE", "350000"))
-                    if price > max_price:
-                        overage = price - max_price
-                        penalty = min(20, (overage / 10000) * 2)
-                        score -= penalty
-                except Exception:
-                    score -= 15
-            elif "below minimum" in reason_lower:
-                score -= 10
+        reasons_lower = [r.lower() for r in review.reasons]
+        for reason_lower in reasons_lower:
+            group = min((m.lastindex for m in _PENALTY_RE.finditer(reason_lower)), default=None)
+            if group is None:
+                continue
+
+            penalty = _PENALTIES[_PENALTY_KEYWORDS[group - 1]]
+            if penalty is None:
+                price = prop.price or 0
+                if price > self.max_price:
+                    overage = price - self.max_price
+                    score -= min(20, (overage / 10000) * 2)
+            else:
+                score -= penalty
 
         # Bonus for good stuff
-        if prop.get("basement_finished"):
+        if prop.basement_finished:
             score += 10
-        if not prop.get("has_pool"):
+        if not prop.has_pool:
             score += 5
-        if prop.get("year_built", 0) >= 2000:
+        if (prop.year_built or 0) >= 2000:
             score += 5
-        if prop.get("sqft", 0) >= 1500:
+        if (prop.sqft or 0) >= 1500:
             score += 3
 
-        insights = self.database.get_market_insights(prop)
+        insights = self._get_market_insights(prop)
         if insights.get("price_vs_avg_percent", 0) < -5:
             score += 10
 
         return score
 
+    def _get_market_insights(self, prop: PropertyData) -> dict[str, Any]:
+        """Market insights with the city aggregates memoized for the current run."""
+        city = prop.city
+        if city and city not in self._city_stats:
+            self._city_stats[city] = self.database.get_city_stats(city)
+        return self.database.get_market_insights(prop, city_stats=self._city_stats.get(city))
+
     @traceable(name="scraper_node")
     def scraper_node(self, state: HouseHunterState) -> HouseHunterState:
         try:
@@ -116,9 +126,6 @@ class HouseHunterGraph:
             state["properties"] = properties
             state["api_calls_used"] = self.scraper.scraper.api_calls_made
 
-            for prop in properties:
-                self.database.mark_property_seen(prop)
-
             logger.info(f"Scraper found {len(properties)} properties")
             return state
 
@@ -128,23 +135,22 @@ class HouseHunterGraph:
             return state
 
     @traceable(name="reviewer_node")
-    def reviewer_node(self, state: HouseHunterState) -> HouseHunterState:
+    async def reviewer_node(self, state: HouseHunterState) -> HouseHunterState:
         try:
             logger.info("Starting reviewer node")
 
             properties = state.get("properties", [])
-            reviewed = []
+            reviewed = await self.reviewer.batch_review(properties)
             passed = []
 
-            for prop in properties:
-                review_result = self.reviewer.review_property(prop)
-                reviewed.append(review_result)
-
-                if review_result["passes"]:
+            for prop, review_result in zip(properties, reviewed):
+                if review_result.passes:
                     passed.append(prop)
-                    logger.info(f"✅ Property passed: {prop.get('address')}")
+                    logger.info(f"✅ Property passed: {prop.address}")
 
-                self.database.mark_property_seen(prop, review_result)
+            # Single write per property, with the review attached; first_seen
+            # still records discovery on insert
+            self.database.bulk_mark_seen(properties, reviewed)
 
             state["reviewed_properties"] = reviewed
             state["passed_properties"] = passed
@@ -171,6 +177,10 @@ class HouseHunterGraph:
             reviewed = state.get("reviewed_properties", [])
             properties = state.get("properties", [])
 
+            prop_map = {p.property_id: p for p in properties}
+            review_map = {r.property_id: r for r in reviewed}
+            notified_ids = self.database.get_notified_ids()
+
             # Nothing passed, find and report the closest miss
             if len(passed) == 0 and len(properties) > 0:
                 logger.info("No properties passed review, finding closest match")
@@ -179,20 +189,15 @@ class HouseHunterGraph:
                 best_score = float('-inf')
 
                 for review in reviewed:
-                    if review["passes"]:
+                    if review.passes:
                         continue
 
-                    prop = None
-                    for p in properties:
-                        if p["property_id"] == review["property_id"]:
-                            prop = p
-                            break
-
+                    prop = prop_map.get(review.property_id)
                     if not prop:
                         continue
 
-                    if self.database.is_property_notified(prop["property_id"]):
-                        logger.info(f"Skipping already notified property: {prop.get('address')}")
+                    if prop.property_id in notified_ids:
+                        logger.info(f"Skipping already notified property: {prop.address}")
                         continue
 
                     score = self._calculate_property_score(prop, review)
@@ -200,15 +205,16 @@ class HouseHunterGraph:
                     if score > best_score:
                         closest_match = prop
                         best_score = score
-                        logger.info(f"New closest match: {prop.get('address')} (score: {score:.2f})")
+                        logger.info(f"New closest match: {prop.address} (score: {score:.2f})")
 
                 if closest_match:
-                    logger.info(f"Sending rejection summary with closest match: {closest_match.get('address')}")
+                    logger.info(f"Sending rejection summary with closest match: {closest_match.address}")
                     await self.summarizer.send_rejection_summary(
                         total_found=len(properties),
                         reviewed_properties=reviewed,
                         api_calls_used=state.get("api_calls_used", 0),
-                        closest_match=closest_match
+                        closest_match=closest_match,
+                        reviews_by_id=review_map,
                     )
                 else:
                     logger.info("No new properties to report - skipping notification")
@@ -216,16 +222,10 @@ class HouseHunterGraph:
                 state["notified_properties"] = []
                 return state
 
-            # Properties passed, notify about each one
-            review_map = {r["property_id"]: r for r in reviewed}
-
-            notified = []
-            for prop in passed:
-                review = review_map.get(prop["property_id"])
-                if review:
-                    success = await self.summarizer.summarize_and_notify(prop, review)
-                    if success:
-                        notified.append(prop["property_id"])
+            # Properties passed, notify about each one concurrently
+            pairs = [(prop, review_map[prop.property_id]) for prop in passed if prop.property_id in review_map]
+            sent = await self.summarizer.summarize_and_notify_many(pairs)
+            notified = [prop.property_id for (prop, _), success in zip(pairs, sent) if success]
 
             state["notified_properties"] = notified
             logger.info(f"Sent {len(notified)} notifications")
@@ -233,11 +233,9 @@ class HouseHunterGraph:
             # Check for price drops
             if state.get("should_notify", True):
                 logger.info("Checking for price drops...")
-                price_drops = self.database.get_properties_with_price_drops(min_drop_percent=2.0)
-                for prop_dict in price_drops:
-                    if not self.database.is_property_notified(prop_dict.get("property_id")):
-                        await self.summarizer.send_price_drop_notification(prop_dict)
-                logger.info(f"Sent {len(price_drops)} price drop notifications")
+                price_drops = self.database.get_properties_with_price_drops(min_drop_percent=2.0, unnotified_only=True)
+                sent_drops = await self.summarizer.send_price_drop_notifications(price_drops)
+                logger.info(f"Sent {sent_drops}/{len(price_drops)} price drop notifications")
 
             return state
 
@@ -246,7 +244,21 @@ class HouseHunterGraph:
             state["errors"].append({"node": "summarizer", "error": str(e)})
             return state
 
+    def reset(self):
+        """Clear per-run state so one graph instance can serve every scheduled run."""
+        self._city_stats = {}
+        self.scraper.scraper.reset_budget()
+
+        # Clean up old entries before each run
+        try:
+            deleted = self.database.cleanup_old_entries(days_to_keep=90)
+            if deleted > 0:
+                logger.info(f"Database cleanup: removed {deleted} old entries")
+        except Exception as e:
+            logger.warning(f"Database cleanup failed: {e}")
+
     async def run(self, test_mode: bool = False) -> dict[str, Any]:
+        self.reset()
         try:
             initial_state = {
                 "run_id": str(uuid.uuid4()),
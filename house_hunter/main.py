@@ -2,36 +2,44 @@
 
 import argparse
 import asyncio
+import functools
 import logging
 import sys
+import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+from ._http import aclose_http_client
 from .graph import HouseHunterGraph
 from .scheduler import HouseHunterScheduler
 
-# Ensure logs directory exists
-project_root = Path(__file__).parent.parent
-logs_dir = project_root / "logs"
-logs_dir.mkdir(exist_ok=True)
+logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(logs_dir / 'house_hunter.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 
-logger = logging.getLogger(__name__)
+@functools.cache
+def _init_once():
+    """Logging + .env setup. Done on first entry rather than at import so importing is side-effect free."""
+    # Ensure logs directory exists
+    project_root = Path(__file__).parent.parent
+    logs_dir = project_root / "logs"
+    logs_dir.mkdir(exist_ok=True)
 
-load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(logs_dir / 'house_hunter.log'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+    load_dotenv()
 
 
 async def run_once(test_mode: bool = False):
     """Run the house hunter workflow once."""
+    _init_once()
     try:
         logger.info("=" * 60)
         logger.info("🏠 HOUSE HUNTER - SINGLE RUN")
@@ -62,8 +70,12 @@ async def run_once(test_mode: bool = False):
         logger.error(f"Error running house hunter: {e}")
         raise
 
+    finally:
+        await aclose_http_client()
+
 
 def run_scheduler():
+    _init_once()
     try:
         logger.info("=" * 60)
         logger.info("🏠 HOUSE HUNTER - SCHEDULER MODE")
@@ -80,9 +92,10 @@ def run_scheduler():
 
         scheduler.start()
 
+        # BackgroundScheduler runs jobs on its own thread; just park the main one
+        stop = threading.Event()
         try:
-            while True:
-                asyncio.run(asyncio.sleep(1))
+            stop.wait()
         except KeyboardInterrupt:
             logger.info("Shutting down scheduler...")
             scheduler.stop()
@@ -93,6 +106,7 @@ def run_scheduler():
 
 
 def main():
+    _init_once()
     parser = argparse.ArgumentParser(description="House Hunter Agent System")
     parser.add_argument("--once", action="store_true", help="Run once and exit")
     parser.add_argument("--test", action="store_true", help="Run in test mode (no notifications)")
@@ -103,8 +117,8 @@ def main():
 
     try:
         if args.stats:
-            from .database import PropertyDatabase
-            db = PropertyDatabase()
+            from .database import get_db
+            db = get_db()
             stats = db.get_statistics()
 
             print("\n" + "=" * 60)
@@ -3,25 +3,123 @@ Reviewer agent. Validates properties against search criteria using
 a quick filter pass + GPT-4o-mini for the detailed stuff.
 """
 
+import asyncio
+import hashlib
+import itertools
 import json
 import logging
 import os
+import re
 from datetime import datetime
 from typing import Any
 
-from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
+from ._http import get_http_client
+from .database import get_db
 from .state import PropertyData, ReviewResult
 
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # optional speedup; only .loads is used
+    import json as orjson
+
 logger = logging.getLogger(__name__)
 
+# Everything _format_property_for_llm sends; a change to any of these invalidates the cached verdict
+_FINGERPRINT_FIELDS = (
+    "property_id", "address", "city", "price", "beds", "baths", "sqft", "year_built",
+    "lot_size", "property_type", "has_basement", "basement_finished", "has_pool",
+)
+_NON_WORD_RE = re.compile(r"[\W_]+")
+_SINGLE_FAMILY_RE = re.compile(r"single|house", re.I)
+
+# Explains the compact property summaries; sent once in the system message
+_COMPACT_LEGEND = (
+    "Property fields: A=address, C=city/state, P=price (USD), B=bedrooms, Ba=bathrooms, "
+    "Sq=square feet, Y=year built, Lot=lot size (sq ft), T=property type, "
+    "Bsmt=basement status from listing data, Pool=yes/no, D=listing description (truncated)"
+)
+
+# Last key in the verdict schema and the only one we don't use - once the model
+# starts writing it, everything we need has been streamed
+_EARLY_STOP_KEY = '"highlights"'
+
+
+def _verdicts_complete(parsed: Any) -> bool:
+    """True when every verdict in an early-stopped parse already carries `passes`."""
+    if not isinstance(parsed, dict):
+        return False
+    entries = parsed.get("results", [parsed])
+    return isinstance(entries, list) and bool(entries) and all(
+        isinstance(entry, dict) and "passes" in entry for entry in entries
+    )
+
+# Prompt bodies; {criteria} is filled in once per agent, the rest per call
+_REVIEW_PROMPT = """You are a property reviewer helping someone find their perfect home.
+Analyze this property against the following STRICT criteria:
+
+{criteria}
+Property Details:
+{property_summary}
+
+Analyze this property carefully. Consider:
+1. Does it meet ALL the must-have criteria?
+2. Are there any dealbreakers?
+3. Is the basement clearly finished/partially finished, or is it ambiguous/unclear?
+4. Any concerns even if it technically passes?
+
+Respond in JSON format with SHORT reasons (5-10 words max):
+{{
+    "passes": true/false,
+    "reasons": ["ONLY list SHORT reasons why it FAILS - leave empty if it passes"],
+    "concerns": ["any concerns even if it passes"],
+    "missing_info": ["important information that's missing"],
+    "basement_status": "finished|partial|unfinished|unclear|none",
+    "highlights": ["best features if it passes"]
+}}
+"""
+
+_BATCH_REVIEW_PROMPT = """You are a property reviewer helping someone find their perfect home.
+Analyze EACH of the following {count} properties independently against these STRICT criteria:
+
+{criteria}
+Properties:
+{summaries}
+
+For each property consider:
+1. Does it meet ALL the must-have criteria?
+2. Are there any dealbreakers?
+3. Is the basement clearly finished/partially finished, or is it ambiguous/unclear?
+4. Any concerns even if it technically passes?
+
+Respond in JSON format with one entry per property and SHORT reasons (5-10 words max):
+{{
+    "results": [
+        {{
+            "index": 1,
+            "passes": true/false,
+            "reasons": ["ONLY list SHORT reasons why it FAILS - leave empty if it passes"],
+            "concerns": ["any concerns even if it passes"],
+            "missing_info": ["important information that's missing"],
+            "basement_status": "finished|partial|unfinished|unclear|none",
+            "highlights": ["best features if it passes"]
+        }}
+    ]
+}}
+"""
+
 
 class ReviewerAgent:
 
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self._http = get_http_client()
+        self.aclient = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=self._http)
+
+        # Max in-flight GPT-4o-mini requests during batch_review
+        self.llm_concurrency = int(os.getenv("HOUSE_HUNTER_LLM_CONCURRENCY", "8"))
+        # Properties packed into one GPT-4o-mini request - the criteria preamble is sent once per batch
+        self.llm_batch_size = max(1, int(os.getenv("HOUSE_HUNTER_LLM_BATCH", "6")))
 
         # Load criteria from environment
         self.min_price = int(os.getenv("HOUSE_HUNTER_MIN_PRICE", "200000"))
@@ -29,43 +127,71 @@ class ReviewerAgent:
         current_year = datetime.now().year
         self.min_year = current_year - 100
 
-        # Cities to avoid
+        # HOUSE_HUNTER_VERBOSE_PROMPTS=1 sends the labelled multi-line summary (easier to debug)
+        self.verbose_prompts = os.getenv("HOUSE_HUNTER_VERBOSE_PROMPTS") == "1"
+        self.state = os.getenv("HOUSE_HUNTER_STATE", "OH")
+
+        # Cities to avoid, lowercased so the match is case-insensitive
         avoid_str = os.getenv("HOUSE_HUNTER_AVOID_CITIES", "")
-        self.avoid_cities = [c.strip() for c in avoid_str.split(",") if c.strip()]
+        self.avoid_cities = frozenset(c.strip().lower() for c in avoid_str.split(",") if c.strip())
+
+        # Criteria are fixed for the agent's lifetime, so bake them into the prompts once.
+        # str.replace keeps the escaped JSON braces intact for the per-call .format().
+        criteria = self._criteria_block()
+        self._prompt_template = _REVIEW_PROMPT.replace("{criteria}", criteria)
+        self._batch_prompt_template = _BATCH_REVIEW_PROMPT.replace("{criteria}", criteria)
+        system_prompt = "You are a thorough property analyst. Be strict about requirements."
+        if not self.verbose_prompts:
+            system_prompt += f"\n{_COMPACT_LEGEND}"
+        self._system_msg = {"role": "system", "content": system_prompt}
+
+        # Cache of LLM verdicts - listings repeat across the 8 daily runs
+        self.db = get_db()
 
         logger.info("ReviewerAgent initialized")
 
-    def review_property(self, property_data: PropertyData) -> ReviewResult:
+    async def review_property(self, property_data: PropertyData, timestamp: str | None = None) -> ReviewResult:
         """Run quick checks, then LLM review if it survives."""
         try:
             quick_check = self._quick_validation(property_data)
             if not quick_check["passes"]:
                 return self._create_review_result(
-                    property_data["property_id"],
+                    property_data.property_id,
                     passes=False,
                     reasons=quick_check["reasons"],
                     concerns=[],
-                    missing_info=quick_check.get("missing_info", [])
+                    missing_info=quick_check.get("missing_info", []),
+                    timestamp=timestamp
                 )
 
-            return self._llm_review(property_data)
+            return await self._llm_review(property_data, timestamp)
 
         except Exception as e:
-            logger.error(f"Error reviewing property {property_data.get('property_id')}: {e}")
+            logger.error(f"Error reviewing property {property_data.property_id}: {e}")
             return self._create_review_result(
-                property_data.get("property_id"),
+                property_data.property_id,
                 passes=False,
                 reasons=[f"Review failed: {str(e)}"],
                 concerns=[],
-                missing_info=[]
+                missing_info=[],
+                timestamp=timestamp
             )
 
     def _quick_validation(self, property_data: PropertyData) -> dict[str, Any]:
-        """Price, location, age, type, pool - cheap checks before hitting the API."""
+        """
+        Pool, price, type, location, age - cheap checks before hitting the API, most
+        decisive first so `reasons[:2]` in the batch log shows the dealbreakers.
+        The checks don't stop at the first failure: each reason carries its own
+        closest-miss penalty in graph._PENALTIES, so a pool + Cleveland reject must
+        still rank below a pool-only one.
+        """
         reasons = []
         missing_info = []
 
-        price = property_data.get("price")
+        if property_data.has_pool:
+            reasons.append("Has a pool (dealbreaker)")
+
+        price = property_data.price
         if price:
             if price < self.min_price:
                 reasons.append(f"Price ${price:,} is below minimum ${self.min_price:,}")
@@ -74,44 +200,159 @@ class ReviewerAgent:
         else:
             missing_info.append("Price information missing")
 
-        city = property_data.get("city", "").strip()
-        if city in self.avoid_cities:
+        prop_type = property_data.property_type
+        if prop_type and not _SINGLE_FAMILY_RE.search(prop_type):
+            reasons.append(f"Property type is {prop_type.lower()} (not single-family)")
+
+        city = (property_data.city or "").strip()
+        if city.lower() in self.avoid_cities:
             reasons.append(f"Located in {city} (excluded area)")
 
-        year_built = property_data.get("year_built")
+        year_built = property_data.year_built
         if year_built and year_built < self.min_year:
             reasons.append("Over 100 years old")
 
-        prop_type = property_data.get("property_type", "").lower()
-        if prop_type and "single" not in prop_type and "house" not in prop_type:
-            reasons.append(f"Property type is {prop_type} (not single-family)")
-
-        if property_data.get("has_pool"):
-            reasons.append("Has a pool (dealbreaker)")
-
         return {
-            "passes": len(reasons) == 0,
+            "passes": not reasons,
             "reasons": reasons,
             "missing_info": missing_info
         }
 
-    def _llm_review(self, property_data: PropertyData) -> ReviewResult:
+    async def _llm_review(self, property_data: PropertyData, timestamp: str | None = None) -> ReviewResult:
         """
         Send property to GPT-4o-mini for detailed analysis. Mainly needed because
         basement data in the API is unreliable - sometimes it's in details, sometimes
         features, sometimes only the description text mentions it.
         """
         try:
+            fingerprint = self._fingerprint(property_data)
+            cached = self.db.get_cached_review(fingerprint)
+            if cached:
+                logger.info(f"Using cached LLM review for {property_data.address}")
+                return self._create_review_result(property_data.property_id, **cached, timestamp=timestamp)
+
             property_summary = self._format_property_for_llm(property_data)
 
-            avoid_clause = ""
-            if self.avoid_cities:
-                avoid_clause = f"- Location in {' or '.join(self.avoid_cities)}\n"
+            prompt = self._prompt_template.format(property_summary=property_summary)
 
-            prompt = f"""You are a property reviewer helping someone find their perfect home.
-Analyze this property against the following STRICT criteria:
+            llm_result = await self._stream_json(prompt, max_tokens=500)
+
+            verdict = self._verdict_from_llm(property_data, llm_result)
+            self.db.cache_review(fingerprint, verdict)
+
+            return self._create_review_result(property_data.property_id, **verdict, timestamp=timestamp)
+
+        except Exception as e:
+            logger.error(f"LLM review failed: {e}")
+            return self._create_review_result(
+                property_data.property_id,
+                passes=False,
+                reasons=["LLM review failed, property rejected for safety"],
+                concerns=[],
+                missing_info=[],
+                timestamp=timestamp
+            )
+
+    async def _llm_review_batch(self, props: list[PropertyData], timestamp: str | None = None) -> list[ReviewResult]:
+        """
+        Review several properties in one GPT-4o-mini call. Same criteria as _llm_review,
+        but the preamble is paid once per batch; verdicts are mapped back by index.
+        """
+        if len(props) == 1:
+            return [await self._llm_review(props[0], timestamp)]
+
+        try:
+            summaries = "\n\n".join(
+                f"[{i}]\n{self._format_property_for_llm(p)}" for i, p in enumerate(props, 1)
+            )
+
+            prompt = self._batch_prompt_template.format(count=len(props), summaries=summaries)
+
+            llm_result = await self._stream_json(
+                prompt, max_tokens=400 * len(props), stop_after=len(props), closer="}]}"
+            )
+
+            by_index = {}
+            for entry in llm_result.get("results", []):
+                if isinstance(entry, dict) and isinstance(entry.get("index"), int):
+                    by_index[entry["index"]] = entry
+
+        except Exception as e:
+            logger.error(f"Batched LLM review of {len(props)} properties failed: {e}")
+            by_index = {}
+
+        results = []
+        for i, prop in enumerate(props, 1):
+            llm_result = by_index.get(i)
+            if llm_result is None:
+                logger.warning(f"No batched verdict for {prop.address}, rejecting for safety")
+                results.append(self._create_review_result(
+                    prop.property_id,
+                    passes=False,
+                    reasons=["LLM review failed, property rejected for safety"],
+                    concerns=[],
+                    missing_info=[],
+                    timestamp=timestamp
+                ))
+                continue
+
+            verdict = self._verdict_from_llm(prop, llm_result)
+            self.db.cache_review(self._fingerprint(prop), verdict)
+            results.append(self._create_review_result(prop.property_id, **verdict, timestamp=timestamp))
 
-MUST HAVE (all required):
+        return results
+
+    async def _stream_json(self, prompt: str, max_tokens: int, stop_after: int = 1, closer: str = "}") -> dict[str, Any]:
+        """
+        Stream a JSON completion and hang up once the model has started the
+        `stop_after`-th "highlights" key, closing the truncated body with `closer`.
+        If that early parse fails, or a verdict in it is still missing `passes`
+        (keys out of order), wait for the full response.
+        """
+        stream = await self.aclient.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                self._system_msg,
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.3,
+            max_tokens=max_tokens,
+            stream=True
+        )
+
+        text = ""
+        hits = 0
+        try:
+            async for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+
+                # Only rescan the tail that could hold a key split across chunks
+                scan_from = max(0, len(text) - len(_EARLY_STOP_KEY) + 1)
+                text += chunk.choices[0].delta.content
+                hits += text.count(_EARLY_STOP_KEY, scan_from)
+
+                if hits >= stop_after:
+                    head = text[:text.rfind(_EARLY_STOP_KEY)].rstrip().rstrip(",")
+                    try:
+                        parsed = orjson.loads(head + closer)
+                    except ValueError:
+                        parsed = None
+                    if _verdicts_complete(parsed):
+                        return parsed
+                    stop_after = float("inf")  # unexpected shape, read it all
+        finally:
+            await stream.close()
+
+        return orjson.loads(text)
+
+    def _criteria_block(self) -> str:
+        avoid_clause = ""
+        if self.avoid_cities:
+            avoid_clause = f"- Location in {' or '.join(sorted(self.avoid_cities))}\n"
+
+        return f"""MUST HAVE (all required):
 - Price: ${self.min_price:,} - ${self.max_price:,}
 - Year Built: {self.min_year} or newer (no century homes)
 - Finished or Partially Finished basement (must have usable living space in basement - NOT unfinished/bare concrete)
@@ -123,124 +364,181 @@ MUST HAVE (all required):
 MUST NOT HAVE:
 - Swimming pool
 {avoid_clause}- Major structural issues or extensive repairs needed
-
-Property Details:
-{property_summary}
-
-Analyze this property carefully. Consider:
-1. Does it meet ALL the must-have criteria?
-2. Are there any dealbreakers?
-3. Is the basement clearly finished/partially finished, or is it ambiguous/unclear?
-4. Any concerns even if it technically passes?
-
-Respond in JSON format with SHORT reasons (5-10 words max):
-{{
-    "passes": true/false,
-    "reasons": ["ONLY list SHORT reasons why it FAILS - leave empty if it passes"],
-    "concerns": ["any concerns even if it passes"],
-    "missing_info": ["important information that's missing"],
-    "highlights": ["best features if it passes"],
-    "basement_status": "finished|partial|unfinished|unclear|none"
-}}
 """
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a thorough property analyst. Be strict about requirements."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.3,
-                max_tokens=500
-            )
-
-            llm_result = json.loads(response.choices[0].message.content)
-
-            basement_status = llm_result.get("basement_status", "unknown")
-            if basement_status:
-                logger.info(f"LLM basement assessment for {property_data.get('address')}: {basement_status}")
+    def _verdict_from_llm(self, property_data: PropertyData, llm_result: dict[str, Any]) -> dict[str, Any]:
+        """Normalize one LLM answer into the cached verdict shape."""
+        basement_status = llm_result.get("basement_status", "unknown")
+        if basement_status:
+            logger.info(f"LLM basement assessment for {property_data.address}: {basement_status}")
 
-            if not llm_result.get("passes", False) and basement_status in ["unclear", "none", "unfinished"]:
-                if "basement" not in " ".join(llm_result.get("reasons", [])).lower():
-                    llm_result.setdefault("reasons", []).append(f"Basement: {basement_status}")
+        if not llm_result.get("passes", False) and basement_status in ["unclear", "none", "unfinished"]:
+            if "basement" not in " ".join(llm_result.get("reasons", [])).lower():
+                llm_result.setdefault("reasons", []).append(f"Basement: {basement_status}")
 
-            return self._create_review_result(
-                property_data["property_id"],
-                passes=llm_result.get("passes", False),
-                reasons=llm_result.get("reasons", []),
-                concerns=llm_result.get("concerns", []),
-                missing_info=llm_result.get("missing_info", [])
-            )
+        return {
+            "passes": llm_result.get("passes", False),
+            "reasons": llm_result.get("reasons", []),
+            "concerns": llm_result.get("concerns", []),
+            "missing_info": llm_result.get("missing_info", []),
+        }
 
-        except Exception as e:
-            logger.error(f"LLM review failed: {e}")
-            _ = self._quick_validation(property_data)
-            return self._create_review_result(
-                property_data["property_id"],
-                passes=False,
-                reasons=["LLM review failed, property rejected for safety"],
-                concerns=[],
-                missing_info=[]
-            )
+    def _fingerprint(self, property_data: PropertyData) -> str:
+        """
+        Stable hash of the reviewed fields plus the current criteria. The description
+        is normalized so whitespace/punctuation-only edits still hit the cache.
+        """
+        description = property_data.description or ""
+        payload = {k: getattr(property_data, k) for k in _FINGERPRINT_FIELDS}
+        payload["description"] = _NON_WORD_RE.sub(" ", description.lower()).strip()
+        payload["criteria"] = [self.min_price, self.max_price, self.min_year, sorted(self.avoid_cities)]
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
 
     def _format_property_for_llm(self, property_data: PropertyData) -> str:
-        state = os.getenv("HOUSE_HUNTER_STATE", "OH")
+        """Compact `key=value|...` summary; the key legend lives in the system message."""
+        if self.verbose_prompts:
+            return self._format_property_verbose(property_data)
+
+        if property_data.has_basement is None:
+            basement = None
+        elif not property_data.has_basement:
+            basement = "none"
+        else:
+            basement = "finished/partial" if property_data.basement_finished else "unfinished"
+
+        pool = property_data.has_pool
+        parts = (
+            ("A", property_data.address),
+            ("C", f"{property_data.city}, {property_data.state or self.state}"),
+            ("P", property_data.price),
+            ("B", property_data.beds or None),
+            ("Ba", property_data.baths or None),
+            ("Sq", property_data.sqft or None),
+            ("Y", property_data.year_built or None),
+            ("Lot", property_data.lot_size or None),
+            ("T", property_data.property_type),
+            ("Bsmt", basement),
+            ("Pool", None if pool is None else ("yes" if pool else "no")),
+            ("D", property_data.description_short or None),
+        )
+        return "|".join(f"{k}={v}" for k, v in parts if v is not None)
+
+    def _format_property_verbose(self, property_data: PropertyData) -> str:
         lines = []
 
-        lines.append(f"Address: {property_data.get('address', 'Unknown')}")
-        lines.append(f"City: {property_data.get('city', 'Unknown')}, {property_data.get('state', state)}")
-        lines.append(f"Price: ${property_data.get('price', 0):,}")
-
-        if property_data.get("beds"):
-            lines.append(f"Bedrooms: {property_data['beds']}")
-        if property_data.get("baths"):
-            lines.append(f"Bathrooms: {property_data['baths']}")
-        if property_data.get("sqft"):
-            lines.append(f"Square Feet: {property_data['sqft']:,}")
-        if property_data.get("year_built"):
-            lines.append(f"Year Built: {property_data['year_built']}")
-        if property_data.get("lot_size"):
-            lines.append(f"Lot Size: {property_data['lot_size']:,} sq ft")
-
-        lines.append(f"Property Type: {property_data.get('property_type', 'Unknown')}")
-
-        if property_data.get("has_basement") is not None:
-            if property_data["has_basement"]:
-                if property_data.get("basement_finished"):
+        lines.append(f"Address: {property_data.address}")
+        lines.append(f"City: {property_data.city}, {property_data.state or self.state}")
+        if property_data.price is not None:
+            lines.append(f"Price: ${property_data.price:,}")
+
+        if property_data.beds:
+            lines.append(f"Bedrooms: {property_data.beds}")
+        if property_data.baths:
+            lines.append(f"Bathrooms: {property_data.baths}")
+        if property_data.sqft:
+            lines.append(f"Square Feet: {property_data.sqft:,}")
+        if property_data.year_built:
+            lines.append(f"Year Built: {property_data.year_built}")
+        if property_data.lot_size:
+            lines.append(f"Lot Size: {property_data.lot_size:,} sq ft")
+
+        lines.append(f"Property Type: {property_data.property_type}")
+
+        if property_data.has_basement is not None:
+            if property_data.has_basement:
+                if property_data.basement_finished:
                     lines.append("Basement: Finished or Partial")
                 else:
                     lines.append("Basement: Unfinished")
             else:
                 lines.append("Basement: None")
 
-        if property_data.get("has_pool") is not None:
-            lines.append(f"Pool: {'Yes' if property_data['has_pool'] else 'No'}")
+        if property_data.has_pool is not None:
+            lines.append(f"Pool: {'Yes' if property_data.has_pool else 'No'}")
 
-        if property_data.get("description"):
-            lines.append(f"\nDescription: {property_data['description'][:500]}...")
+        if property_data.description_short:
+            lines.append(f"\nDescription: {property_data.description_short}")
 
         return "\n".join(lines)
 
-    def _create_review_result(self, property_id, passes, reasons, concerns, missing_info):
-        return {
-            "property_id": property_id,
-            "passes": passes,
-            "reasons": reasons,
-            "concerns": concerns,
-            "missing_info": missing_info,
-            "review_timestamp": datetime.now().isoformat()
-        }
-
-    def batch_review(self, properties: list[PropertyData]) -> list[ReviewResult]:
-        results = []
-        for i, prop in enumerate(properties, 1):
-            logger.info(f"Reviewing property {i}/{len(properties)}: {prop.get('address')}")
-            result = self.review_property(prop)
-            results.append(result)
+    def _create_review_result(self, property_id, passes, reasons, concerns, missing_info, timestamp=None):
+        return ReviewResult(
+            property_id=property_id,
+            passes=passes,
+            reasons=reasons,
+            concerns=concerns,
+            missing_info=missing_info,
+            review_timestamp=timestamp or datetime.now().isoformat(),
+        )
+
+    async def batch_review(self, properties: list[PropertyData]) -> list[ReviewResult]:
+        """
+        Quick-check everything, then send the survivors that aren't cached to the LLM
+        in batches of `llm_batch_size`, at most `llm_concurrency` batches in flight.
+        """
+        # The shared pool is closed when its event loop ends; rebind to the current one
+        if self._http.is_closed:
+            self._http = get_http_client()
+            self.aclient = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=self._http)
+
+        # Created per call: asyncio primitives are bound to the running loop
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
+        logger.info(f"Reviewing {len(properties)} properties "
+                    f"(LLM batch {self.llm_batch_size}, concurrency {self.llm_concurrency})")
+
+        # One timestamp for the whole batch - per-property precision isn't meaningful
+        ts = datetime.now().isoformat()
+        results: list[ReviewResult | None] = [None] * len(properties)
+        pending = []  # (position, property) still needing the LLM
+
+        for pos, prop in enumerate(properties):
+            try:
+                quick_check = self._quick_validation(prop)
+                if not quick_check["passes"]:
+                    results[pos] = self._create_review_result(
+                        prop.property_id,
+                        passes=False,
+                        reasons=quick_check["reasons"],
+                        concerns=[],
+                        missing_info=quick_check.get("missing_info", []),
+                        timestamp=ts
+                    )
+                    continue
+
+                cached = self.db.get_cached_review(self._fingerprint(prop))
+                if cached:
+                    logger.info(f"Using cached LLM review for {prop.address}")
+                    results[pos] = self._create_review_result(prop.property_id, **cached, timestamp=ts)
+                    continue
+
+                pending.append((pos, prop))
+
+            except Exception as e:
+                logger.error(f"Error reviewing property {prop.property_id}: {e}")
+                results[pos] = self._create_review_result(
+                    prop.property_id,
+                    passes=False,
+                    reasons=[f"Review failed: {str(e)}"],
+                    concerns=[],
+                    missing_info=[],
+                    timestamp=ts
+                )
 
-            if result["passes"]:
-                logger.info(f" Property PASSED: {prop.get('address')}")
+        async def review_chunk(chunk):
+            async with semaphore:
+                reviewed = await self._llm_review_batch([prop for _, prop in chunk], ts)
+            for (pos, _), result in zip(chunk, reviewed):
+                results[pos] = result
+
+        it = iter(pending)
+        chunks = list(iter(lambda: list(itertools.islice(it, self.llm_batch_size)), []))
+        if chunks:
+            logger.info(f"Sending {len(pending)} properties to the LLM in {len(chunks)} request(s)")
+            await asyncio.gather(*(review_chunk(c) for c in chunks))
+
+        for prop, result in zip(properties, results):
+            if result.passes:
+                logger.info(f" Property PASSED: {prop.address}")
             else:
                 logger.info(f"L Property FAILED: {', '.join(result['reasons'][:2])}")
 
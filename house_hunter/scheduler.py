@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import os
+import threading
 from datetime import datetime
 
 from apscheduler.executors.pool import ThreadPoolExecutor
@@ -10,6 +11,7 @@ from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from ._http import aclose_http_client
 from .graph import HouseHunterGraph
 
 logger = logging.getLogger(__name__)
@@ -36,6 +38,15 @@ class HouseHunterScheduler:
             timezone=os.getenv("HOUSE_HUNTER_TIMEZONE", "US/Eastern")
         )
 
+        # Built once and reused by every run; graph.run() resets its per-run state
+        self.graph = HouseHunterGraph()
+
+        # Held for the duration of a run; overlapping fires bail out immediately
+        self._running = threading.Lock()
+
+        # One event loop for every run, so the shared HTTP pool stays warm between fires
+        self._runner = asyncio.Runner()
+
         self._add_jobs()
         logger.info("HouseHunterScheduler initialized")
 
@@ -63,11 +74,14 @@ class HouseHunterScheduler:
         logger.info("Scheduled jobs added: 9 AM, 11 AM, 1 PM, 3 PM, 5 PM, 7 PM, 9 PM, 11 PM daily")
 
     def run_house_hunter(self):
+        if not self._running.acquire(blocking=False):
+            logger.info("Skipped run: prior run still in progress")
+            return
+
         try:
             logger.info(f"Starting scheduled run at {datetime.now()}")
 
-            graph = HouseHunterGraph()
-            result = asyncio.run(graph.run(test_mode=False))
+            result = self._runner.run(self.graph.run(test_mode=False))
 
             logger.info("Scheduled run completed:")
             logger.info(f"  - Found: {len(result.get('properties', []))}")
@@ -77,12 +91,18 @@ class HouseHunterScheduler:
         except Exception as e:
             logger.error(f"Scheduled run failed: {e}")
 
+        finally:
+            self._running.release()
+
     def start(self):
         self.scheduler.start()
         logger.info("Scheduler started")
 
     def stop(self):
         self.scheduler.shutdown()
+        # Pooled connections belong to the runner's loop - close them before it goes
+        self._runner.run(aclose_http_client())
+        self._runner.close()
         logger.info("Scheduler stopped")
 
     def get_jobs(self):
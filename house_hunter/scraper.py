@@ -7,17 +7,203 @@ to stay within the pro tier (10k calls/month, ~8 runs/day).
 API: https://rapidapi.com/nusantaracodedotcom/api/realtor-api-data
 """
 
+import hashlib
 import json
+import logging
 import os
 import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import requests
 from dotenv import load_dotenv
-
-load_dotenv()
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Extra attempts for a failed API call, and the statuses worth another try
+API_RETRIES = 3
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+def _json_loads(data: bytes | str) -> Any:
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """UTF-8 JSON bytes; orjson when installed, stdlib otherwise."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+BASEMENT_PATTERN = r"basement|lower level|walk-?out|daylight basement"
+FINISHED_PATTERN = r"finished|partially finished|partial|renovated|remodeled"
+UNFINISHED_PATTERN = r"unfinished|rough|concrete floor|bare concrete"
+POOL_PATTERN = r"pool"
+
+# Every keyword family in one alternation, so each text is swept once and the named
+# group says which family matched. Unfinished comes first: at the same position it
+# wins, and "finished" inside "unfinished" is consumed rather than counted.
+_SIGNAL_RE = re.compile(
+    f"(?P<unfinished>{UNFINISHED_PATTERN})|(?P<basement>{BASEMENT_PATTERN})"
+    f"|(?P<finished>{FINISHED_PATTERN})|(?P<pool>{POOL_PATTERN})",
+    re.I,
+)
+
+
+# Detail groups Realtor files basement info under ("Basement", "Lower Level", ...)
+_BASEMENT_CATEGORY_RE = re.compile(r"basement|lower level", re.I)
+
+
+def _text_signals(text: str) -> set[str]:
+    """Keyword families ('unfinished', 'basement', 'finished', 'pool') found in `text`."""
+    return {m.lastgroup for m in _SIGNAL_RE.finditer(text)}
+
+
+def _basement_signal(text: str, signals: set[str] | None = None) -> str | None:
+    """'unfinished', 'finished' or 'mentioned' for text that talks about a basement, else None."""
+    if signals is None:
+        signals = _text_signals(text)
+    if "basement" not in signals:
+        return None
+    if "unfinished" in signals:
+        return "unfinished"
+    if "finished" in signals:
+        return "finished"
+    return "mentioned"
+
+
+def _collect_texts(home: dict[str, Any]) -> list[tuple[str, str]]:
+    """
+    Flatten every piece of listing text into (source, text) pairs, once per listing:
+    detail group categories, details[] texts, features[] texts, then the description.
+    Order matters - details[] is the most reliable place for basement info, and within
+    it the groups whose category names the basement go first.
+    """
+    collected = []
+    for source in ("details", "features"):
+        groups = [g for g in home.get(source) or [] if isinstance(g, dict)]
+        if source == "details":
+            # Stable: dedicated basement groups first, the rest in listing order
+            groups.sort(key=lambda g: not _BASEMENT_CATEGORY_RE.search(g.get("category") or ""))
+        for group in groups:
+            if source == "details" and group.get("category"):
+                collected.append(("category", group["category"]))
+            texts = group.get("text", [])
+            if isinstance(texts, list):
+                collected.extend((source, text) for text in texts if isinstance(text, str))
+
+    desc_text = (home.get("description") or {}).get("text")
+    if desc_text:
+        collected.append(("description text", desc_text))
+    return collected
+
+
+def _scan_home(home: dict[str, Any]) -> tuple[bool, bool, str | None, bool]:
+    """
+    Single sweep over the flattened listing text. Pool counts when flagged or mentioned
+    in details[]; the basement verdict comes from the first decisive mention, so
+    features[] and the description only matter if details[] was silent.
+    Returns (has_basement, finished, basement_source, has_pool).
+    """
+    has_pool = bool((home.get("description") or {}).get("pool"))
+    has_basement = False
+    basement = None  # (finished, source) from the first decisive mention
+
+    for source, text in _collect_texts(home):
+        if has_pool:
+            break
+        # Past details[] with the basement settled - nothing left to learn
+        if basement is not None and source not in ("details", "category"):
+            break
+
+        signals = _text_signals(text)
+        if source in ("details", "category") and "pool" in signals:
+            has_pool = True
+            break
+        if source == "category" or basement is not None:
+            continue
+
+        signal = _basement_signal(text, signals)
+        if signal is not None:
+            has_basement = True
+        if signal in ("finished", "unfinished"):
+            basement = (signal == "finished", f"{source}: {text[:50]}")
+
+    if basement is None:
+        return has_basement, False, None, has_pool
+    return True, basement[0], basement[1], has_pool
+
+
+# Bulky detail sections nothing downstream reads; dropped before the response is
+# cached, held for the rest of the run, or archived
+_UNUSED_DETAIL_KEYS = ("photos", "property_history", "tax_history", "schools", "nearby_homes")
+
+
+def _trim_detail(data: Any) -> Any:
+    home = (data.get("data") or {}).get("home") if isinstance(data, dict) else None
+    if isinstance(home, dict):
+        for key in _UNUSED_DETAIL_KEYS:
+            home.pop(key, None)
+    return data
+
+
+# Listings repeat across runs and are analysed by both the scraper and ScraperAgent.
+# Keyed on id + last update + price so an edited listing is re-scanned.
+_ANALYSIS_CACHE: dict[tuple, tuple[bool, bool, str | None, bool]] = {}
+_ANALYSIS_CACHE_MAX = 4096
+
+
+def _analyze_home(home: dict[str, Any]) -> tuple[bool, bool, str | None, bool]:
+    """Memoized _scan_home: (has_basement, basement_finished, basement_source, has_pool)."""
+    property_id = home.get("property_id")
+    if not property_id:
+        return _scan_home(home)
+
+    key = (property_id, home.get("last_update_date"), home.get("list_price"))
+    result = _ANALYSIS_CACHE.get(key)
+    if result is None:
+        result = _scan_home(home)
+        if len(_ANALYSIS_CACHE) >= _ANALYSIS_CACHE_MAX:
+            _ANALYSIS_CACHE.clear()
+        _ANALYSIS_CACHE[key] = result
+    return result
+
+class _TokenBucket:
+    """Thread-safe token bucket. Callers only sleep when the bucket is empty."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Take the token now (possibly going negative) and sleep off the debt
+            # outside the lock, so waiters queue up at the right spacing
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
 
 
 class RealtorAPIScraper:
@@ -38,7 +224,29 @@ class RealtorAPIScraper:
         # Rate limiting: 40 calls/run keeps us under 10k/month
         self.MAX_CALLS = 40
         self.api_calls_made = 0
-        self.delay_between_calls = 0.5
+        # ~2 calls/sec sustained; only blocks when calls actually arrive faster than that
+        self.rate_limiter = _TokenBucket(rate=2.0, capacity=2)
+        self._calls_lock = threading.Lock()
+
+        # Detail fetches in flight at once - they're pure network wait
+        self.detail_concurrency = int(os.getenv("HOUSE_HUNTER_DETAIL_CONCURRENCY", "8"))
+
+        # One pooled session for the whole run - no TCP/TLS handshake per call.
+        # No adapter-level retries: _make_api_call retries itself so every attempt is budgeted.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.detail_concurrency)
+        self.session.mount("https://", adapter)
+
+        # On-disk response cache: listings and details repeat across the ~8 daily runs,
+        # and a cache hit doesn't touch the API budget
+        self.cache_dir = Path(os.getenv(
+            "HOUSE_HUNTER_API_CACHE_DIR", Path(__file__).parent.parent / "data" / "api_cache"
+        ))
+        self.list_cache_ttl = int(os.getenv("HOUSE_HUNTER_LIST_CACHE_TTL", "3600"))
+        self.detail_cache_ttl = int(os.getenv("HOUSE_HUNTER_DETAIL_CACHE_TTL", "86400"))
+        # cache key -> file this run wrote or served, for detail_cache_path
+        self._served_cache_paths: dict[str, str] = {}
 
         # Search criteria
         self.min_price = int(os.getenv("HOUSE_HUNTER_MIN_PRICE", "200000"))
@@ -50,41 +258,149 @@ class RealtorAPIScraper:
 
         self.state = os.getenv("HOUSE_HUNTER_STATE", "OH")
 
-    def _make_api_call(self, method: str, url: str, **kwargs) -> dict[str, Any] | None:
-        """Make API call with rate limiting. Returns None if limit reached."""
-        if self.api_calls_made >= self.MAX_CALLS:
-            print(f"\n⚠️  API CALL LIMIT REACHED ({self.MAX_CALLS} calls)")
+    def _cache_key(self, url: str, params: dict[str, Any] | None) -> str:
+        return hashlib.sha1((url + json.dumps(params or {}, sort_keys=True)).encode()).hexdigest()
+
+    def _cache_get(self, key: str, ttl: int) -> dict[str, Any] | None:
+        try:
+            entry = _json_loads((self.cache_dir / f"{key}.json").read_bytes())
+            if time.time() - entry["ts"] > ttl:
+                return None
+            return entry["body"]
+        except (OSError, ValueError, KeyError, TypeError):
             return None
 
+    def _cache_set(self, key: str, data: dict[str, Any]) -> bool:
         try:
-            if self.api_calls_made > 0:
-                time.sleep(self.delay_between_calls)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a partial file
+            tmp_path = self.cache_dir / f"{key}.{threading.get_ident()}.tmp"
+            tmp_path.write_bytes(_json_dumps({"ts": time.time(), "body": data}))
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+            return True
+        except OSError as e:
+            logger.warning(f"Failed to cache response: {e}")
+            return False
 
-            if 'timeout' not in kwargs:
-                kwargs['timeout'] = 30
+    def _reserve_call(self) -> int | None:
+        """
+        Check-and-increment the budget as one step, so concurrent workers can't all
+        see room and overshoot it. Returns the call number, or None when spent.
+        """
+        with self._calls_lock:
+            if self.api_calls_made >= self.MAX_CALLS:
+                return None
+            self.api_calls_made += 1
+            return self.api_calls_made
 
-            if method.upper() == "POST":
-                response = requests.post(url, headers=self.headers, **kwargs)
-            else:
-                response = requests.get(url, headers=self.headers, **kwargs)
+    def reset_budget(self):
+        """
+        Start a fresh run: new call budget, forget which cache files the last run used,
+        and prune the ones no TTL would serve any more.
+        """
+        with self._calls_lock:
+            self.api_calls_made = 0
+            self._served_cache_paths.clear()
+        self.prune_cache()
 
-            self.api_calls_made += 1
-            print(f"   [API Calls: {self.api_calls_made}/{self.MAX_CALLS}]", end=" ")
+    def prune_cache(self) -> int:
+        """
+        Delete cache files (and orphaned temp files) older than the longest TTL.
+        Expired entries are only skipped on read, so without this the directory
+        grows for as long as the scheduler runs. Returns the number removed.
+        """
+        cutoff = time.time() - max(self.list_cache_ttl, self.detail_cache_ttl)
+        removed = 0
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            return 0
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            logger.info(f"Pruned {removed} expired API cache files")
+        return removed
+
+    def _make_api_call(self, method: str, url: str, cache_ttl: int = 0,
+                       trim: Callable[[Any], Any] | None = None, **kwargs) -> dict[str, Any] | None:
+        """
+        Make API call with rate limiting. Returns None if limit reached. Thread-safe.
+        GET responses younger than `cache_ttl` seconds are served from disk without
+        spending a call. `trim`, if given, is applied to the parsed body before it is
+        cached or returned.
+        """
+        cache_key = None
+        if cache_ttl > 0 and method.upper() == "GET":
+            cache_key = self._cache_key(url, kwargs.get("params"))
+            cached = self._cache_get(cache_key, cache_ttl)
+            if cached is not None:
+                logger.debug("Cache hit for %s %s", url, kwargs.get("params"))
+                self._served_cache_paths[cache_key] = str(self.cache_dir / f"{cache_key}.json")
+                return cached
+
+        if 'timeout' not in kwargs:
+            kwargs['timeout'] = 30
+
+        # Transient 5xx/network failures are retried with backoff, but every attempt
+        # spends a budgeted call and a rate-limiter token. 429 is never retried -
+        # on RapidAPI it usually means the quota itself is gone.
+        response = None
+        for attempt in range(API_RETRIES + 1):
+            if attempt:
+                time.sleep(0.5 * 2 ** (attempt - 1))
+
+            call_number = self._reserve_call()
+            if call_number is None:
+                logger.warning(f"API call limit reached ({self.MAX_CALLS} calls)")
+                return None
+
+            try:
+                self.rate_limiter.acquire()
+                if method.upper() == "POST":
+                    response = self.session.post(url, **kwargs)
+                else:
+                    response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                logger.warning(f"API error (attempt {attempt + 1}): {e}")
+                response = None
+                continue
+            except Exception as e:
+                logger.warning(f"API error: {e}")
+                return None
 
+            logger.debug("API calls: %d/%d", call_number, self.MAX_CALLS)
+            if response.status_code not in _RETRY_STATUSES:
+                break
+            logger.warning(f"API error: status {response.status_code} (attempt {attempt + 1})")
+
+        if response is None:
+            return None
+
+        try:
             if response.status_code == 200:
-                return response.json()
+                data = _json_loads(response.content)
+                if trim is not None:
+                    data = trim(data)
+                # Don't pin an API-level failure in the cache
+                if cache_key and isinstance(data, dict) and data.get("success") is not False:
+                    if self._cache_set(cache_key, data):
+                        self._served_cache_paths[cache_key] = str(self.cache_dir / f"{cache_key}.json")
+                return data
             else:
-                print(f"\n   ❌ Error: Status {response.status_code}")
                 try:
                     error_body = response.json()
-                    print(f"   ❌ Response: {error_body}")
                 except Exception:
-                    print(f"   ❌ Response: {response.text[:200]}")
+                    error_body = response.text[:200]
+                logger.warning(f"API error: status {response.status_code}, response: {error_body}")
                 return None
 
         except Exception as e:
-            self.api_calls_made += 1
-            print(f"\n   ❌ Error: {str(e)}")
+            logger.warning(f"API error: {e}")
             return None
 
     def search_properties(self, max_details: int = 30) -> list[dict[str, Any]]:
@@ -106,13 +422,14 @@ class RealtorAPIScraper:
         print("STEP 1: Fetching Property Lists")
         print(f"{'=' * 80}")
 
-        for city in self.priority_cities:
-            if self.api_calls_made >= self.MAX_CALLS:
-                break
-
-            print(f"\n🔍 Searching {city}, {self.state}...")
+        # City lists are independent - fetch them all at once. The call budget is
+        # enforced inside _make_api_call, so cities past the limit just come back empty.
+        print(f"\n🔍 Searching {', '.join(self.priority_cities)} ({self.state})...")
+        with ThreadPoolExecutor(max_workers=max(1, min(len(self.priority_cities), 5))) as pool:
+            city_results = list(pool.map(self._fetch_property_list, self.priority_cities))
 
-            properties = self._fetch_property_list(city)
+        for city, properties in zip(self.priority_cities, city_results):
+            print(f"\n🔍 {city}, {self.state}")
             if properties:
                 print(f"   ✅ Found {len(properties)} properties")
                 all_properties.extend(properties)
@@ -126,11 +443,14 @@ class RealtorAPIScraper:
         print("STEP 2: Client-Side Filtering")
         print(f"{'=' * 80}")
 
-        filtered = self._filter_basic(all_properties)
-        print(f"✅ After filtering: {len(filtered)} properties")
-
-        random.shuffle(filtered)
-        print(f"🔀 Randomized property order for variety")
+        # Random pick among the survivors for variety, sized to what we can afford
+        calls_left = self.MAX_CALLS - self.api_calls_made
+        print(f"\n🔍 Filtering {len(all_properties)} properties by price...")
+        selected, passed = self._reservoir_sample(
+            self._filter_basic(all_properties), max(0, min(max_details, calls_left))
+        )
+        print(f"✅ After filtering: {passed} properties")
+        print(f"🔀 Randomly picked {len(selected)} for variety")
 
         # Step 3: Fetch details for top properties
         print(f"\n{'=' * 80}")
@@ -138,40 +458,38 @@ class RealtorAPIScraper:
         print(f"{'=' * 80}")
 
         matching = []
-        calls_left = self.MAX_CALLS - self.api_calls_made
-        to_fetch = min(len(filtered), max_details, calls_left)
+        to_fetch = len(selected)
 
-        print(f"\n📥 Fetching details for {to_fetch} properties...")
+        print(f"\n📥 Fetching details for {to_fetch} properties "
+              f"({self.detail_concurrency} at a time)...")
 
-        for i, prop in enumerate(filtered[:to_fetch], 1):
-            if self.api_calls_made >= self.MAX_CALLS:
-                print("\n⚠️  Stopping at API limit")
-                break
-
-            address = prop.get("location", {}).get("address", {}).get("line", "Unknown")
+        def fetch(prop):
             property_id = prop.get("property_id") or prop.get("id") or prop.get("listing_id")
+            return prop, property_id, self._fetch_property_details(property_id)
 
-            print(f"\n[{i}/{to_fetch}] {address} (ID: {property_id})...", end=" ")
-
-            details = self._fetch_property_details(property_id)
-            if details:
-                # dump first result for debugging
-                if i == 1 and not matching:
-                    try:
-                        debug_path = Path(__file__).parent / "debug_property_details.json"
-                        with open(debug_path, 'w') as f:
-                            json.dump(details, f, indent=2)
-                    except Exception:
-                        pass
-
-                print("Checking criteria...", end=" ")
-                if self._check_final_criteria(details):
-                    print("✅ MATCH!")
-                    matching.append(details)
-                else:
-                    print("❌")
+        # Fetch concurrently, but check results in list order so the output reads the same
+        with ThreadPoolExecutor(max_workers=self.detail_concurrency) as pool:
+            fetched = list(pool.map(fetch, selected))
+
+        for i, (prop, property_id, details) in enumerate(fetched, 1):
+            if details and self._check_final_criteria(details):
+                matching.append(details)
+                outcome, level = "MATCH", logging.INFO
             else:
-                print("No details returned")
+                outcome, level = ("no match" if details else "no details returned"), logging.DEBUG
+
+            # Only dig the address out when the line will actually be emitted
+            if logger.isEnabledFor(level):
+                address = prop.get("location", {}).get("address", {}).get("line", "Unknown")
+                logger.log(level, "[%d/%d] %s (ID: %s): %s", i, to_fetch, address, property_id, outcome)
+
+        # Dump the first detail response for debugging, once the fetches are done
+        if os.getenv("HOUSE_HUNTER_DEBUG") and fetched and fetched[0][2]:
+            try:
+                debug_path = Path(__file__).parent / "debug_property_details.json"
+                debug_path.write_bytes(_json_dumps(fetched[0][2], indent=True))
+            except Exception:
+                pass
 
         return matching
 
@@ -187,7 +505,7 @@ class RealtorAPIScraper:
             "bath": self.min_baths
         }
 
-        data = self._make_api_call("GET", url, params=params)
+        data = self._make_api_call("GET", url, cache_ttl=self.list_cache_ttl, params=params)
 
         if data and data.get("success"):
             properties = data.get("data", {}).get("home_search", {}).get("results", [])
@@ -200,29 +518,52 @@ class RealtorAPIScraper:
             return None
 
         url = f"https://{self.api_host}/detail/properties"
-        return self._make_api_call("GET", url, params={"id": property_id})
+        return self._make_api_call(
+            "GET", url, cache_ttl=self.detail_cache_ttl, trim=_trim_detail, params={"id": property_id}
+        )
 
-    def _filter_basic(self, properties: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Client-side price filter before we spend API calls on details."""
-        filtered = []
+    def detail_cache_path(self, property_id: str) -> str | None:
+        """
+        Cache file holding the detail response ({"ts", "body"}) this run actually
+        wrote or served for the property. None if the fetch failed or wasn't cached,
+        so a stale file from an earlier run is never passed off as current data.
+        """
+        if not property_id:
+            return None
 
-        print(f"\n🔍 Filtering {len(properties)} properties by price...")
+        url = f"https://{self.api_host}/detail/properties"
+        return self._served_cache_paths.get(self._cache_key(url, {'id': property_id}))
 
+    @staticmethod
+    def _reservoir_sample(items, k: int) -> tuple[list, int]:
+        """
+        Uniform random sample of up to `k` items in one pass, without building or
+        shuffling the full list. Returns (sample, number of items seen).
+        """
+        reservoir = []
+        seen = 0
+        for seen, item in enumerate(items, 1):
+            if len(reservoir) < k:
+                reservoir.append(item)
+            else:
+                j = random.randrange(seen)
+                if j < k:
+                    reservoir[j] = item
+        return reservoir, seen
+
+    def _filter_basic(self, properties: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Client-side price filter before we spend API calls on details. Lazy."""
         for prop in properties:
             price = prop.get("list_price") or prop.get("price", 0)
-            address = prop.get("location", {}).get("address", {}).get("line", "Unknown")
-
-            print(f"\n   🏠 {address}")
-            print(f"      Price: ${price:,}")
-
-            if price < self.min_price or price > self.max_price:
-                print("      ❌ Price out of range")
-                continue
+            in_range = self.min_price <= price <= self.max_price
 
-            print("      ✅ Passed price filter")
-            filtered.append(prop)
+            if logger.isEnabledFor(logging.DEBUG):
+                address = prop.get("location", {}).get("address", {}).get("line", "Unknown")
+                logger.debug("%s ($%s): %s", address, f"{price:,}",
+                             "passed price filter" if in_range else "price out of range")
 
-        return filtered
+            if in_range:
+                yield prop
 
     def _check_final_criteria(self, details: dict[str, Any]) -> bool:
         """
@@ -233,7 +574,7 @@ class RealtorAPIScraper:
         description text as a fallback. Only accept explicitly finished/partial.
         """
         if not details:
-            print("(no details)", end=" ")
+            logger.debug("Rejected: no details")
             return False
 
         home = details.get("data", {}).get("home", {})
@@ -243,116 +584,34 @@ class RealtorAPIScraper:
         description = home.get("description", {})
 
         # Single-family only
-        prop_type = description.get("type", "").lower()
+        prop_type = (description.get("type") or "").casefold()
         if not any(t in prop_type for t in ["single", "family", "house", "residential"]):
-            print(f"(not single-family: '{prop_type}')", end=" ")
+            logger.debug("Rejected: not single-family ('%s')", prop_type)
             return False
 
-        # Basement check: need FINISHED or PARTIAL
-        has_finished_or_partial_basement = False
-        basement_source = None
-
-        basement_keywords = ["basement", "lower level", "walkout", "walk-out", "daylight basement"]
-        finished_keywords = ["finished", "partially finished", "partial", "renovated", "remodeled"]
-        unfinished_keywords = ["unfinished", "rough", "concrete floor", "bare concrete"]
-
-        # 1. Check details array (most reliable)
-        details_list = home.get("details", [])
-        for detail_group in details_list:
-            if isinstance(detail_group, dict):
-                texts = detail_group.get("text", [])
-                category = detail_group.get("category", "").lower()
-
-                if isinstance(texts, list):
-                    for text in texts:
-                        if isinstance(text, str):
-                            text_lower = text.lower()
-
-                            has_basement_mention = any(kw in text_lower for kw in basement_keywords)
-
-                            if has_basement_mention:
-                                if any(kw in text_lower for kw in unfinished_keywords):
-                                    print("(unfinished basement)", end=" ")
-                                    return False
-
-                                if any(kw in text_lower for kw in finished_keywords):
-                                    has_finished_or_partial_basement = True
-                                    basement_source = f"details: {text[:50]}"
-                                    break
-
-                if has_finished_or_partial_basement:
-                    break
-
-        # 2. Check features array
-        if not has_finished_or_partial_basement:
-            features = home.get("features", [])
-            for feature_group in features:
-                if isinstance(feature_group, dict):
-                    texts = feature_group.get("text", [])
-                    if isinstance(texts, list):
-                        for text in texts:
-                            if isinstance(text, str):
-                                text_lower = text.lower()
-                                has_basement_mention = any(kw in text_lower for kw in basement_keywords)
-
-                                if has_basement_mention:
-                                    if any(kw in text_lower for kw in unfinished_keywords):
-                                        print("(unfinished basement)", end=" ")
-                                        return False
-
-                                    if any(kw in text_lower for kw in finished_keywords):
-                                        has_finished_or_partial_basement = True
-                                        basement_source = f"features: {text[:50]}"
-                                        break
-
-                    if has_finished_or_partial_basement:
-                        break
-
-        # 3. Description text as last resort
-        if not has_finished_or_partial_basement:
-            desc_text = description.get("text", "")
-            if desc_text:
-                desc_lower = desc_text.lower()
-                has_basement_mention = any(kw in desc_lower for kw in basement_keywords)
-
-                if has_basement_mention:
-                    if any(kw in desc_lower for kw in unfinished_keywords):
-                        print("(unfinished basement)", end=" ")
-                        return False
-
-                    if any(kw in desc_lower for kw in finished_keywords):
-                        has_finished_or_partial_basement = True
-                        basement_source = "description text"
-
-        if not has_finished_or_partial_basement:
-            print("(no finished/partial basement found)", end=" ")
+        # Pool flag is free - check it before any text scanning
+        if description.get("pool"):
+            logger.debug("Rejected: has pool")
             return False
 
-        if basement_source:
-            print(f"(basement from {basement_source})", end=" ")
+        # Pool + basement signals, shared with ScraperAgent via the memoized analysis
+        _, finished, basement_source, has_pool = _analyze_home(home)
 
         # Pool check (must NOT have)
-        has_pool = description.get("pool") or False
-
-        for detail_group in details_list:
-            if isinstance(detail_group, dict):
-                category = detail_group.get("category", "").lower()
-                texts = detail_group.get("text", [])
-
-                if "pool" in category:
-                    has_pool = True
-                    break
-
-                if isinstance(texts, list):
-                    for text in texts:
-                        if isinstance(text, str) and "pool" in text.lower():
-                            has_pool = True
-                            break
-
         if has_pool:
-            print("(has pool)", end=" ")
+            logger.debug("Rejected: has pool")
+            return False
+
+        # Basement check: need FINISHED or PARTIAL
+        if not finished:
+            if basement_source:
+                logger.debug("Rejected: unfinished basement (%s)", basement_source)
+            else:
+                logger.debug("Rejected: no finished/partial basement found")
             return False
 
+        logger.debug("Basement from %s", basement_source)
+
         return True
 
     def print_results(self, properties: list[dict[str, Any]]):
@@ -384,11 +643,11 @@ class RealtorAPIScraper:
             print(f"📅 Year: {description.get('year_built', 'N/A')}")
             print(f"🔗 URL: {home.get('href', 'N/A')}")
 
-    def save_results(self, properties: list[dict[str, Any]], filename: str = "matching_properties"):
+    def save_results(self, properties: list[dict[str, Any]], filename: str = "matching_properties", pretty: bool = False):
+        """Compact JSON by default; pretty=True indents it for reading by hand."""
         try:
             filepath = Path(__file__).parent / f"{filename}.json"
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(properties, f, indent=2, ensure_ascii=False)
+            filepath.write_bytes(_json_dumps(properties, indent=pretty))
             print(f"\n💾 Saved to: {filename}.json")
         except Exception as e:
             print(f"\n❌ Failed to save: {str(e)}")
@@ -402,7 +661,7 @@ class RealtorAPIScraper:
         print(f"📈 Monthly Budget: ~{10000 - (self.api_calls_made * 240)}/10,000 estimated remaining")
 
 
-def main():
+def main(pretty: bool = False):
     print("\n" + "=" * 80)
     print("🏠 HOUSE HUNTER")
     print("=" * 80)
@@ -413,7 +672,7 @@ def main():
         scraper.print_results(matching)
 
         if matching:
-            scraper.save_results(matching)
+            scraper.save_results(matching, pretty=pretty)
 
         scraper.print_summary()
 
@@ -430,4 +689,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Search Realtor listings directly")
+    parser.add_argument("--pretty", action="store_true", help="Indent the saved JSON for debugging")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    load_dotenv()
+    main(pretty=args.pretty)
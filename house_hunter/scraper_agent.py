@@ -1,13 +1,18 @@
 """Adapter between the raw Realtor API scraper and the LangGraph workflow."""
 
 import logging
+import re
 from typing import Any
 
-from .scraper import RealtorAPIScraper
+from .scraper import RealtorAPIScraper, _analyze_home
 from .state import PropertyData
 
 logger = logging.getLogger(__name__)
 
+DESCRIPTION_SHORT_CHARS = 500
+
+BATHTUB_RE = re.compile(r"tub|soaking", re.I)
+
 
 class ScraperAgent:
 
@@ -45,89 +50,48 @@ class ScraperAgent:
             description = home.get("description", {})
 
             # Basement detection: check multiple places because the API is inconsistent
-            has_basement = False
-            basement_finished = False
-            has_bathtub = False
-            basement_source = None
-
-            basement_keywords = ["basement", "lower level", "walkout", "walk-out", "daylight basement"]
-            finished_keywords = ["finished", "finish", "partial", "partially finished", "renovated"]
+            # Same (memoized) analysis the scraper used to accept the listing
+            has_basement, basement_finished, basement_source, has_pool = _analyze_home(home)
 
-            # 1. details array
-            details = home.get("details", [])
-            for detail_group in details:
+            has_bathtub = False
+            for detail_group in home.get("details", []):
                 if isinstance(detail_group, dict):
-                    texts = detail_group.get("text", [])
-                    category = detail_group.get("category", "").lower()
-
-                    for text in texts:
-                        if isinstance(text, str):
-                            text_lower = text.lower()
-
-                            if any(kw in text_lower for kw in basement_keywords):
-                                has_basement = True
-                                if any(kw in text_lower for kw in finished_keywords):
-                                    basement_finished = True
-                                    basement_source = "details"
-
-                            if "bathtub" in category or "bathroom" in category:
-                                if "tub" in text_lower or "bathtub" in text_lower or "soaking" in text_lower:
-                                    has_bathtub = True
-
-            # 2. features array
-            if not basement_finished:
-                features = home.get("features", [])
-                for feature_group in features:
-                    if isinstance(feature_group, dict):
-                        texts = feature_group.get("text", [])
-                        for text in texts:
-                            if isinstance(text, str):
-                                text_lower = text.lower()
-                                if any(kw in text_lower for kw in basement_keywords):
-                                    has_basement = True
-                                    if any(kw in text_lower for kw in finished_keywords):
-                                        basement_finished = True
-                                        basement_source = "features"
-                                        break
-                        if basement_finished:
-                            break
+                    category = (detail_group.get("category") or "").casefold()
+                    if "bathtub" not in category and "bathroom" not in category:
+                        continue
 
-            # 3. description text as fallback
-            if not basement_finished:
-                desc_text = description.get("text", "")
-                if desc_text:
-                    desc_lower = desc_text.lower()
-                    if any(kw in desc_lower for kw in basement_keywords):
-                        has_basement = True
-                        if any(kw in desc_lower for kw in finished_keywords):
-                            basement_finished = True
-                            basement_source = "description"
+                    for text in detail_group.get("text", []):
+                        if isinstance(text, str) and BATHTUB_RE.search(text):
+                            has_bathtub = True
+                            break
 
             if basement_finished and basement_source:
                 logger.info(f"Basement detected from {basement_source}: {home.get('property_id')}")
 
-            return {
-                "property_id": home.get("property_id", ""),
-                "address": address.get("line", ""),
-                "city": address.get("city", ""),
-                "state": address.get("state_code", "OH"),
-                "zip_code": address.get("postal_code", ""),
-                "price": home.get("list_price", 0),
-                "beds": description.get("beds"),
-                "baths": description.get("baths"),
-                "sqft": description.get("sqft"),
-                "year_built": description.get("year_built"),
-                "lot_size": description.get("lot_sqft"),
-                "property_type": description.get("type", ""),
-                "description": description.get("text", ""),
-                "listing_url": home.get("href", ""),
-                "photo_url": home.get("primary_photo", {}).get("href", ""),
-                "has_basement": has_basement,
-                "basement_finished": basement_finished,
-                "has_pool": description.get("pool", False),
-                "has_bathtub": has_bathtub,
-                "raw_data": raw_data
-            }
+            return PropertyData(
+                property_id=home.get("property_id", ""),
+                address=address.get("line", ""),
+                city=address.get("city", ""),
+                state=address.get("state_code", "OH"),
+                zip_code=address.get("postal_code", ""),
+                price=home.get("list_price", 0),
+                beds=description.get("beds"),
+                baths=description.get("baths"),
+                sqft=description.get("sqft"),
+                year_built=description.get("year_built"),
+                lot_size=description.get("lot_sqft"),
+                property_type=description.get("type", ""),
+                description=description.get("text", ""),
+                # What the reviewer prompt gets - sliced once here instead of per review
+                description_short=(description.get("text") or "")[:DESCRIPTION_SHORT_CHARS],
+                listing_url=home.get("href", ""),
+                photo_url=home.get("primary_photo", {}).get("href", ""),
+                has_basement=has_basement,
+                basement_finished=basement_finished,
+                has_pool=has_pool,
+                has_bathtub=has_bathtub,
+                raw_data_path=self.scraper.detail_cache_path(home.get("property_id"))
+            )
         except Exception as e:
             logger.error(f"Error converting property data: {e}")
             return None
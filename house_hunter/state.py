@@ -1,40 +1,70 @@
 """State definitions for the house hunter workflow."""
 
+from dataclasses import asdict, dataclass, field
 from typing import Any, TypedDict
 
 
-class PropertyData(TypedDict):
+class _FieldAccess:
+    """
+    Read-only dict-style access (`x["price"]`, `x.get("price")`, `"price" in x`) for the
+    code that handles these records interchangeably with plain dicts - database rows,
+    the Telegram formatters, market insights.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.__dataclass_fields__:
+            return default
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__dataclass_fields__
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class PropertyData(_FieldAccess):
     """A single property from the API."""
     property_id: str
-    address: str
-    city: str
-    state: str
-    zip_code: str
-    price: int
-    beds: int | None
-    baths: float | None
-    sqft: int | None
-    year_built: int | None
-    lot_size: int | None
-    property_type: str
-    description: str | None
-    listing_url: str | None
-    photo_url: str | None
-    has_basement: bool | None
-    basement_finished: bool | None
-    has_pool: bool | None
-    has_bathtub: bool | None
-    raw_data: dict[str, Any]
-
-
-class ReviewResult(TypedDict):
+    address: str = ""
+    city: str = ""
+    state: str = ""
+    zip_code: str = ""
+    price: int = 0
+    beds: int | None = None
+    baths: float | None = None
+    sqft: int | None = None
+    year_built: int | None = None
+    lot_size: int | None = None
+    property_type: str = ""
+    description: str | None = None
+    description_short: str | None = None
+    listing_url: str | None = None
+    photo_url: str | None = None
+    has_basement: bool | None = None
+    basement_finished: bool | None = None
+    has_pool: bool | None = None
+    has_bathtub: bool | None = None
+    # Cached detail response on disk; load lazily instead of carrying it in the state
+    raw_data_path: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ReviewResult(_FieldAccess):
     """Output from the reviewer agent."""
     property_id: str
     passes: bool
-    reasons: list[str]
-    concerns: list[str]
-    missing_info: list[str]
-    review_timestamp: str
+    reasons: list[str] = field(default_factory=list)
+    concerns: list[str] = field(default_factory=list)
+    missing_info: list[str] = field(default_factory=list)
+    review_timestamp: str = ""
 
 
 class HouseHunterState(TypedDict):
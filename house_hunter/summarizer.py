@@ -1,19 +1,121 @@
 """Telegram notifications. Formats property data and sends it."""
 
+import asyncio
+import functools
+import heapq
 import logging
 import os
+import time
+from collections import deque
+from operator import itemgetter
 
-from dotenv import load_dotenv
-from openai import OpenAI
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.constants import ParseMode
+from telegram.error import RetryAfter
+from telegram.request import HTTPXRequest
 
-from .database import PropertyDatabase
+from .database import get_db
 from .state import PropertyData, ReviewResult
 
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Telegram's bot-wide send limit (messages per second)
+SEND_RATE_LIMIT = 30
+# Minimum seconds between messages to one chat: about 1/s for a private chat,
+# 20/min for groups (negative chat ids). This is the limit a single chat_id hits.
+CHAT_SEND_INTERVAL = 1.0
+GROUP_CHAT_SEND_INTERVAL = 3.0
+
+_NEW_HOUSE_HEADER = "🏠 <b>NEW HOUSE FOUND!</b> 🏠\n"
+_NEW_HOUSE_TEMPLATE = (
+    _NEW_HOUSE_HEADER + "\n"
+    "📍 <b>Address:</b> {address}\n"
+    "🏙️ <b>City:</b> {city}, {state}\n"
+    "💰 <b>Price:</b> ${price:,}\n"
+)
+_TEMPLATE_DEFAULTS = {"address": "Unknown", "city": "Unknown", "price": 0}
+
+# (field, format) for the "3 bed | 2 bath | ..." line; empty fields are left out
+_DETAIL_FIELDS = (
+    ("beds", "🛏️ {} bed"),
+    ("baths", "🛁 {} bath"),
+    ("sqft", "📏 {:,} sqft"),
+    ("year_built", "📅 Built {}"),
+)
+# Header plus the full details line, pre-joined from the two tables above for the
+# common case where every detail field is set; one format_map renders both
+_NEW_HOUSE_FULL_TEMPLATE = (
+    _NEW_HOUSE_TEMPLATE + "\n"
+    + " | ".join(fmt.replace("{", "{" + key, 1) for key, fmt in _DETAIL_FIELDS) + "\n"
+)
+_PRICE_DROP_HEADER = "💰📉 <b>PRICE DROP ALERT!</b> 💰📉\n"
+
+# (max days on market, line) - the first bucket that fits wins
+_DOM_BUCKETS = (
+    (0, "  🆕 Just listed today!"),
+    (1, "  🆕 Listed yesterday"),
+    (7, "  🔥 Listed {days} days ago (fresh!)"),
+    (30, "  📅 On market {days} days"),
+    (60, "  ⏰ On market {days} days (getting stale)"),
+)
+_DOM_OVER = "  ⚠️ On market {days} days (price negotiable?)"
+
+_PRICE_DROP_DOM_BUCKETS = (
+    (30, "  📅 {days} days on market"),
+    (60, "  ⏰ {days} days on market (motivated seller?)"),
+)
+_PRICE_DROP_DOM_OVER = "  ⚠️ {days} days on market (very motivated!)"
+
+
+class _OrjsonRequest(HTTPXRequest):
+    """HTTPXRequest that decodes Telegram's responses with orjson."""
+
+    @staticmethod
+    def parse_json_payload(payload: bytes):
+        try:
+            return orjson.loads(payload)
+        except ValueError:
+            # Let the stock parser raise its usual TelegramError
+            return HTTPXRequest.parse_json_payload(payload)
+
+
+class _TemplateFields:
+    """format_map source over a property record: extra values first, then the record, then defaults."""
+    __slots__ = ("_record", "_extra")
+
+    def __init__(self, record, **extra):
+        self._record = record
+        self._extra = extra
+
+    def __getitem__(self, key):
+        if key in self._extra:
+            return self._extra[key]
+        value = self._record.get(key)
+        return _TEMPLATE_DEFAULTS.get(key, "") if value is None or value == "" else value
+
+
+def _details_line(record, fields=_DETAIL_FIELDS) -> str | None:
+    details = [fmt.format(value) for key, fmt in fields if (value := record.get(key))]
+    return " | ".join(details) + "\n" if details else None
+
+
+def _money(amount) -> str:
+    return f"${amount or 0:,}"
+
+
+def _view_listing_kb(url: str | None, label: str = "🏠 View Full Listing") -> InlineKeyboardMarkup | None:
+    """Single-button keyboard linking to the listing, or None when there's no URL."""
+    return InlineKeyboardMarkup.from_button(InlineKeyboardButton(label, url=url)) if url else None
+
+
+def _days_on_market_line(days: int, buckets: tuple, over: str) -> str:
+    return next((line for limit, line in buckets if days <= limit), over).format(days=days)
+
 
 class SummarizerAgent:
 
@@ -24,157 +126,230 @@ class SummarizerAgent:
         if not self.bot_token or not self.chat_id:
             raise ValueError("HOUSE_HUNTER_BOT_TOKEN and HOUSE_HUNTER_CHAT_ID must be set")
 
-        self.bot = Bot(token=self.bot_token)
-        self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.db = PropertyDatabase()
+        self.state = os.getenv("HOUSE_HUNTER_STATE", "OH")
+        self.max_price = int(os.getenv("HOUSE_HUNTER_MAX_PRICE", "350000"))
+
+        # One HTTP client for the agent's lifetime; every send goes through the single
+        # _sender_loop, so one keep-alive connection is all it ever uses
+        self.bot = Bot(
+            token=self.bot_token,
+            request=(_OrjsonRequest if orjson else HTTPXRequest)(
+                connection_pool_size=1, connect_timeout=5, read_timeout=10
+            ),
+        )
+        self._send_message = functools.partial(
+            self.bot.send_message,
+            chat_id=self.chat_id,
+            parse_mode=ParseMode.HTML,
+            disable_web_page_preview=True,
+        )
+        self.db = get_db()
+
+        # Outbound messages go through one sender task so bursts stay under Telegram's limits
+        self._queue: asyncio.Queue | None = None
+        self._sender: asyncio.Task | None = None
+        self._sent_at: deque[float] = deque(maxlen=SEND_RATE_LIMIT)
+        self._chat_sent_at: dict[str, float] = {}
+        self._chat_interval = GROUP_CHAT_SEND_INTERVAL if self.chat_id.startswith("-") else CHAT_SEND_INTERVAL
         logger.info("SummarizerAgent initialized")
 
+    async def _send(self, text: str, reply_markup=None):
+        """Queue a message for the rate-limited sender and wait until it's delivered (or failed)."""
+        loop = asyncio.get_running_loop()
+        # The sender is tied to the loop that started it; start a fresh one per loop
+        if self._sender is None or self._sender.done() or self._sender.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._sender = asyncio.create_task(self._sender_loop())
+
+        delivered = loop.create_future()
+        await self._queue.put((text, reply_markup, delivered))
+        return await delivered
+
+    async def _sender_loop(self):
+        while True:
+            text, reply_markup, delivered = await self._queue.get()
+            try:
+                if not delivered.done():
+                    delivered.set_result(await self._deliver(text, reply_markup))
+            except Exception as e:
+                if not delivered.done():
+                    delivered.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, text: str, reply_markup=None):
+        """Send one message, holding the whole queue while Telegram asks us to back off."""
+        while True:
+            # Sliding one-second window over the last SEND_RATE_LIMIT sends
+            if len(self._sent_at) == SEND_RATE_LIMIT:
+                wait = 1.0 - (time.monotonic() - self._sent_at[0])
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            # Per-chat spacing, so a burst to one chat doesn't lean on RetryAfter
+            last = self._chat_sent_at.get(self.chat_id)
+            if last is not None:
+                wait = self._chat_interval - (time.monotonic() - last)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._sent_at.append(time.monotonic())
+            self._chat_sent_at[self.chat_id] = time.monotonic()
+
+            try:
+                return await self._send_message(text=text, reply_markup=reply_markup)
+            except RetryAfter as e:
+                delay = e.retry_after
+                delay = delay.total_seconds() if hasattr(delay, "total_seconds") else float(delay)
+                logger.warning(f"Telegram rate limit hit, pausing sends for {delay:.0f}s")
+                await asyncio.sleep(delay)
+
     async def summarize_and_notify(self, property_data: PropertyData, review_result: ReviewResult, force_notify: bool = False) -> bool:
         try:
             property_id = property_data["property_id"]
 
-            if not force_notify and self.db.is_property_notified(property_id):
-                logger.info(f"Property {property_id} already notified")
-                return False
-
-            message = self._format_telegram_message(property_data, review_result)
-            success = await self._send_telegram_notification(message, property_data)
+            if force_notify:
+                insights = self.db.get_market_insights(property_data)
+            else:
+                notified, insights = self.db.get_notification_and_insights(property_id, property_data)
+                if notified:
+                    logger.info(f"Property {property_id} already notified")
+                    return False
 
+            success = await self._notify(property_data, review_result, insights)
             if success:
                 self.db.mark_property_notified(property_id, success=True)
-                logger.info(f"✅ Notification sent for {property_id}")
 
             return success
         except Exception as e:
             logger.error(f"Error in summarize_and_notify: {e}")
             return False
 
-    def _format_telegram_message(self, property_data: PropertyData, review_result: ReviewResult) -> str:
-        state = os.getenv("HOUSE_HUNTER_STATE", "OH")
-        lines = [
-            "🏠 <b>NEW HOUSE FOUND!</b> 🏠\n",
-            f"📍 <b>Address:</b> {property_data.get('address', 'Unknown')}",
-            f"🏙️ <b>City:</b> {property_data.get('city', 'Unknown')}, {state}",
-            f"💰 <b>Price:</b> ${property_data.get('price', 0):,}\n"
-        ]
-
-        details = []
-        if property_data.get('beds'):
-            details.append(f"🛏️ {property_data['beds']} bed")
-        if property_data.get('baths'):
-            details.append(f"🛁 {property_data['baths']} bath")
-        if property_data.get('sqft'):
-            details.append(f"📏 {property_data['sqft']:,} sqft")
-        if property_data.get('year_built'):
-            details.append(f"📅 Built {property_data['year_built']}")
-
-        if details:
-            lines.append(" | ".join(details) + "\n")
+    async def _notify(self, property_data: PropertyData, review_result: ReviewResult, insights: dict | None = None) -> bool:
+        """Format and send; marking the property notified is left to the caller."""
+        message = self._format_telegram_message(property_data, review_result, insights=insights)
+        success = await self._send_telegram_notification(message, property_data)
+        if success:
+            logger.info(f"✅ Notification sent for {property_data['property_id']}")
+        return success
+
+    async def summarize_and_notify_many(self, pairs: list[tuple[PropertyData, ReviewResult]]) -> list[bool]:
+        """
+        Notify for several properties; results line up with `pairs`. The messages are
+        formatted and queued together, but _sender_loop still delivers them one at a time
+        within SEND_RATE_LIMIT. The sent ones are marked notified in one write afterwards.
+        """
+        # Notified flags and market insights for the whole batch in one query
+        lookups = self.db.get_notifications_and_insights([p for p, _ in pairs])
+
+        async def notify(property_data, review_result):
+            notified, insights = lookups.get(property_data["property_id"], (False, None))
+            if notified:
+                logger.info(f"Property {property_data['property_id']} already notified")
+                return False
+            return await self._notify(property_data, review_result, insights)
+
+        results = await asyncio.gather(*(notify(p, r) for p, r in pairs), return_exceptions=True)
+
+        sent = []
+        for (property_data, _), result in zip(pairs, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error notifying {property_data['property_id']}: {result}")
+            elif result:
+                sent.append(property_data["property_id"])
+        self.db.mark_many_notified(sent)
+
+        return [result is True for result in results]
+
+    def _format_telegram_message(self, property_data: PropertyData, review_result: ReviewResult,
+                                 insights: dict | None = None) -> str:
+        if insights is None:
+            insights = self.db.get_market_insights(property_data)
+        return "\n".join(self._iter_message_lines(property_data, insights))
+
+    def _iter_message_lines(self, property_data: PropertyData, insights: dict):
+        fields = _TemplateFields(property_data, state=self.state)
+        if all(property_data.get(key) for key, _ in _DETAIL_FIELDS):
+            yield _NEW_HOUSE_FULL_TEMPLATE.format_map(fields)
+        else:
+            yield _NEW_HOUSE_TEMPLATE.format_map(fields)
+            details = _details_line(property_data)
+            if details:
+                yield details
 
         # Market insights
-        insights = self.db.get_market_insights(property_data)
         if insights:
-            lines.append("<b>📊 Market Insights:</b>")
+            city = property_data.get('city')
+            yield "<b>📊 Market Insights:</b>"
 
             if "days_on_market" in insights:
-                days = insights["days_on_market"]
-                if days == 0:
-                    lines.append("  🆕 Just listed today!")
-                elif days == 1:
-                    lines.append("  🆕 Listed yesterday")
-                elif days <= 7:
-                    lines.append(f"  🔥 Listed {days} days ago (fresh!)")
-                elif days <= 30:
-                    lines.append(f"  📅 On market {days} days")
-                elif days <= 60:
-                    lines.append(f"  ⏰ On market {days} days (getting stale)")
-                else:
-                    lines.append(f"  ⚠️ On market {days} days (price negotiable?)")
+                yield _days_on_market_line(insights["days_on_market"], _DOM_BUCKETS, _DOM_OVER)
 
             if "price_vs_avg_percent" in insights:
                 diff_percent = insights["price_vs_avg_percent"]
                 if diff_percent < -5:
-                    lines.append(f"  💚 {abs(diff_percent):.0f}% below average for {property_data.get('city')}!")
+                    yield f"  💚 {abs(diff_percent):.0f}% below average for {city}!"
                 elif diff_percent < 5:
-                    lines.append(f"  📊 Right at market average for {property_data.get('city')}")
+                    yield f"  📊 Right at market average for {city}"
                 else:
-                    lines.append(f"  📈 {diff_percent:.0f}% above average for {property_data.get('city')}")
+                    yield f"  📈 {diff_percent:.0f}% above average for {city}"
 
             if "price_per_sqft_vs_avg" in insights:
-                diff = insights["price_per_sqft_vs_avg"]
                 prop_psf = insights["property_price_per_sqft"]
-                if diff < 0:
-                    lines.append(f"  💵 ${prop_psf}/sqft (great value!)")
+                if insights["price_per_sqft_vs_avg"] < 0:
+                    yield f"  💵 ${prop_psf}/sqft (great value!)"
                 else:
-                    lines.append(f"  💵 ${prop_psf}/sqft")
+                    yield f"  💵 ${prop_psf}/sqft"
 
-            lines.append("")
+            yield ""
 
-        lines.append("<b>✅ WHY IT PASSED:</b>")
+        yield "<b>✅ WHY IT PASSED:</b>"
         if property_data.get('basement_finished'):
-            lines.append("  ✓ Finished basement")
+            yield "  ✓ Finished basement"
         if not property_data.get('has_pool'):
-            lines.append("  ✓ No pool")
-        if property_data.get('price', 0) <= int(os.getenv("HOUSE_HUNTER_MAX_PRICE", "350000")):
-            lines.append("  ✓ Within budget")
-
-        return "\n".join(lines)
+            yield "  ✓ No pool"
+        if property_data.get('price', 0) <= self.max_price:
+            yield "  ✓ Within budget"
 
     async def _send_telegram_notification(self, message: str, property_data: PropertyData) -> bool:
         try:
-            keyboard = None
-            if property_data.get('listing_url'):
-                keyboard = InlineKeyboardMarkup([
-                    [InlineKeyboardButton("🏠 View Full Listing", url=property_data['listing_url'])]
-                ])
-
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=ParseMode.HTML,
-                reply_markup=keyboard,
-                disable_web_page_preview=True
-            )
+            await self._send(message, _view_listing_kb(property_data.get('listing_url')))
             return True
         except Exception as e:
             logger.error(f"Telegram send failed: {e}")
             return False
 
-    async def send_price_drop_notification(self, property_dict: dict) -> bool:
+    async def send_price_drop_notifications(self, property_dicts: list[dict]) -> int:
+        """Send a batch of price drop alerts, then mark the delivered ones notified in one write."""
+        results = await asyncio.gather(*(self.send_price_drop_notification(p, mark=False) for p in property_dicts))
+        self.db.mark_many_notified([p.get("property_id") for p, sent in zip(property_dicts, results) if sent])
+        return sum(results)
+
+    async def send_price_drop_notification(self, property_dict: dict, mark: bool = True) -> bool:
         try:
-            state = os.getenv("HOUSE_HUNTER_STATE", "OH")
+            old_price, new_price, savings = map(_money, (
+                property_dict.get('old_price'), property_dict.get('new_price'), property_dict.get('drop_amount')
+            ))
             lines = [
-                "💰📉 <b>PRICE DROP ALERT!</b> 💰📉\n",
+                _PRICE_DROP_HEADER,
                 f"📍 <b>Address:</b> {property_dict.get('address', 'Unknown')}",
-                f"🏙️ <b>City:</b> {property_dict.get('city', 'Unknown')}, {state}\n",
-                f"<b>Old Price:</b> <s>${property_dict.get('old_price', 0):,}</s>",
-                f"<b>New Price:</b> ${property_dict.get('new_price', 0):,}",
-                f"<b>💸 Savings:</b> ${property_dict.get('drop_amount', 0):,} ({property_dict.get('drop_percent', 0):.1f}% off!)\n"
+                f"🏙️ <b>City:</b> {property_dict.get('city', 'Unknown')}, {self.state}\n",
+                f"<b>Old Price:</b> <s>{old_price}</s>",
+                f"<b>New Price:</b> {new_price}",
+                f"<b>💸 Savings:</b> {savings} ({property_dict.get('drop_percent', 0):.1f}% off!)\n"
             ]
 
-            details = []
-            if property_dict.get('beds'):
-                details.append(f"🛏️ {property_dict['beds']} bed")
-            if property_dict.get('baths'):
-                details.append(f"🛁 {property_dict['baths']} bath")
-            if property_dict.get('sqft'):
-                details.append(f"📏 {property_dict['sqft']:,} sqft")
-
+            # Price drop alerts leave out year built
+            details = _details_line(property_dict, _DETAIL_FIELDS[:3])
             if details:
-                lines.append(" | ".join(details) + "\n")
+                lines.append(details)
 
             insights = self.db.get_market_insights(property_dict)
             if insights:
                 lines.append("<b>📊 After Price Drop:</b>")
 
                 if "days_on_market" in insights:
-                    days = insights["days_on_market"]
-                    if days <= 30:
-                        lines.append(f"  📅 {days} days on market")
-                    elif days <= 60:
-                        lines.append(f"  ⏰ {days} days on market (motivated seller?)")
-                    else:
-                        lines.append(f"  ⚠️ {days} days on market (very motivated!)")
+                    lines.append(_days_on_market_line(
+                        insights["days_on_market"], _PRICE_DROP_DOM_BUCKETS, _PRICE_DROP_DOM_OVER
+                    ))
 
                 if "price_vs_avg_percent" in insights:
                     diff_percent = insights["price_vs_avg_percent"]
@@ -190,21 +365,10 @@ class SummarizerAgent:
 
             message = "\n".join(lines)
 
-            keyboard = None
-            if property_dict.get('listing_url'):
-                keyboard = InlineKeyboardMarkup([
-                    [InlineKeyboardButton("🏠 View Listing", url=property_dict['listing_url'])]
-                ])
-
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=ParseMode.HTML,
-                reply_markup=keyboard,
-                disable_web_page_preview=True
-            )
-
-            self.db.mark_property_notified(property_dict.get('property_id'), success=True)
+            await self._send(message, _view_listing_kb(property_dict.get('listing_url'), "🏠 View Listing"))
+
+            if mark:
+                self.db.mark_property_notified(property_dict.get('property_id'), success=True)
             logger.info(f"Sent price drop notification for {property_dict.get('property_id')}")
             return True
 
@@ -212,45 +376,36 @@ class SummarizerAgent:
             logger.error(f"Failed to send price drop notification: {e}")
             return False
 
-    async def send_rejection_summary(self, total_found, reviewed_properties, api_calls_used, closest_match=None):
-        """Send the "no matches" message with the closest miss."""
+    async def send_rejection_summary(self, total_found, reviewed_properties, api_calls_used, closest_match=None,
+                                     reviews_by_id=None):
+        """
+        Send the "no matches" message with the closest miss. Pass `reviews_by_id` if the
+        caller already has the reviews keyed by property_id.
+        """
         try:
             lines = [
                 "🏠💔 <b>No Perfect Matches Yet!</b>\n"
             ]
 
             if closest_match:
-                closest_match_review = None
-                for review in reviewed_properties:
-                    if review["property_id"] == closest_match.get("property_id"):
-                        closest_match_review = review
-                        break
+                if reviews_by_id is None:
+                    reviews_by_id = {r["property_id"]: r for r in reviewed_properties}
+                closest_match_review = reviews_by_id.get(closest_match.get("property_id"))
 
                 lines.append("✨ <b>Closest match:</b>")
                 lines.append(f"📍 {closest_match.get('address', 'Unknown')}")
-                lines.append(f"💰 ${closest_match.get('price', 0):,}")
+                lines.append(f"💰 {_money(closest_match.get('price'))}")
 
                 if closest_match_review and closest_match_review.get("reasons"):
                     lines.append("\n<b>Issues with this one:</b>")
                     for reason in closest_match_review["reasons"]:
-                        short_reason = reason[:50] + "..." if len(reason) > 50 else reason
+                        short_reason = f"{reason[:50]}..." if len(reason) > 50 else reason
                         lines.append(f"  ❌ {short_reason}")
 
             message = "\n".join(lines)
 
-            keyboard = None
-            if closest_match and closest_match.get('listing_url'):
-                keyboard = InlineKeyboardMarkup([
-                    [InlineKeyboardButton("👀 Check It Out Anyway", url=closest_match['listing_url'])]
-                ])
-
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=ParseMode.HTML,
-                reply_markup=keyboard,
-                disable_web_page_preview=True
-            )
+            url = closest_match.get('listing_url') if closest_match else None
+            await self._send(message, _view_listing_kb(url, "👀 Check It Out Anyway"))
 
             if closest_match:
                 property_id = closest_match.get("property_id")
@@ -272,16 +427,12 @@ class SummarizerAgent:
             ]
 
             if error_details:
-                lines.append(f"\n<b>Details:</b>\n<code>{error_details[:500]}</code>")
+                details = error_details if len(error_details) <= 500 else error_details[:500]
+                lines.append(f"\n<b>Details:</b>\n<code>{details}</code>")
 
             message = "\n".join(lines)
 
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=ParseMode.HTML,
-                disable_web_page_preview=True
-            )
+            await self._send(message)
 
             logger.info("Sent error notification")
             return True
@@ -292,7 +443,7 @@ class SummarizerAgent:
 
     async def send_weekly_summary(self) -> bool:
         try:
-            stats = self.db.get_statistics()
+            stats = self.db.get_statistics(city_limit=5)
 
             lines = [
                 "📊 <b>Weekly House Hunter Summary</b> 📊\n",
@@ -307,19 +458,14 @@ class SummarizerAgent:
             by_city = stats.get('by_city', {})
             if by_city:
                 lines.append("\n<b>By City:</b>")
-                for city, count in sorted(by_city.items(), key=lambda x: x[1], reverse=True)[:5]:
+                for city, count in heapq.nlargest(5, by_city.items(), key=itemgetter(1)):
                     lines.append(f"  • {city}: {count}")
 
             lines.append(f"\n<b>Total Properties Tracked:</b> {stats.get('total_properties', 0)}")
 
             message = "\n".join(lines)
 
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=ParseMode.HTML,
-                disable_web_page_preview=True
-            )
+            await self._send(message)
 
             logger.info("Sent weekly summary")
             return True
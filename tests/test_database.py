@@ -0,0 +1,45 @@
+from house_hunter.database import NOTIFICATION_LOOKUP_CHUNK, PropertyDatabase
+
+
+def _seed(db, count):
+    props = [
+        {"property_id": f"p{i}", "address": f"{i} Main St", "city": ("Akron", "Kent", "Stow")[i % 3],
+         "price": 150000 + i * 1000, "sqft": 1200 + i}
+        for i in range(count)
+    ]
+    db.bulk_mark_seen(props)
+    return props
+
+
+def test_notifications_and_insights_match_the_per_property_queries(tmp_path):
+    db = PropertyDatabase(str(tmp_path / "test.db"))
+    props = _seed(db, NOTIFICATION_LOOKUP_CHUNK + 10)
+    db.mark_many_notified(["p1", "p500"])
+    props.append({"property_id": "unseen", "city": "Akron", "price": 99000})
+
+    lookups = db.get_notifications_and_insights(props)
+
+    assert len(lookups) == len(props)
+    for prop in props:
+        notified, insights = lookups[prop["property_id"]]
+        if prop["property_id"] in ("p1", "p500"):
+            assert (notified, insights) == (True, {})
+        else:
+            assert (notified, insights) == (False, db.get_market_insights(prop))
+
+
+def test_bulk_mark_seen_archives_the_cached_detail_response(tmp_path):
+    db = PropertyDatabase(str(tmp_path / "test.db"))
+    detail = tmp_path / "detail.json"
+    detail.write_text('{"ts": 0, "body": {"description": "finished basement"}}')
+
+    db.bulk_mark_seen([
+        {"property_id": "p1", "address": "1 Elm St", "city": "Akron", "price": 180000, "raw_data_path": str(detail)},
+        {"property_id": "p2", "address": "2 Oak St", "city": "Kent", "price": 0},
+    ])
+
+    stored = {p["property_id"]: p for p in db.get_recent_properties()}
+    assert stored["p1"]["raw_data"] == {"description": "finished basement"}
+    assert stored["p2"]["raw_data"] == {}
+    prices = db.conn.execute("SELECT property_id, price FROM price_history").fetchall()
+    assert [tuple(row) for row in prices] == [("p1", 180000)]
@@ -0,0 +1,95 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from house_hunter.reviewer import ReviewerAgent
+from house_hunter.state import PropertyData
+
+
+class _FakeStream:
+    """Async chunk stream like openai's, recording how far it was read."""
+
+    def __init__(self, text, chunk_size=7):
+        self.pieces = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+        self.read = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.read == len(self.pieces):
+            raise StopAsyncIteration
+        piece = self.pieces[self.read]
+        self.read += 1
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+    async def close(self):
+        self.closed = True
+
+
+def _agent_streaming(text):
+    stream = _FakeStream(text)
+
+    async def create(**kwargs):
+        return stream
+
+    agent = ReviewerAgent.__new__(ReviewerAgent)
+    agent._system_msg = {"role": "system", "content": ""}
+    agent.aclient = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return agent, stream
+
+
+def test_stream_json_stops_early_once_verdict_is_complete():
+    body = json.dumps({"passes": True, "reasons": [], "basement_status": "finished",
+                       "highlights": ["big yard"] * 20})
+    agent, stream = _agent_streaming(body)
+
+    result = asyncio.run(agent._stream_json("prompt", max_tokens=500))
+
+    assert result["passes"] is True
+    assert "highlights" not in result
+    assert stream.read < len(stream.pieces)
+    assert stream.closed
+
+
+def test_stream_json_reads_on_when_passes_comes_after_highlights():
+    body = json.dumps({"highlights": ["big yard"], "reasons": [], "passes": True})
+    agent, stream = _agent_streaming(body)
+
+    result = asyncio.run(agent._stream_json("prompt", max_tokens=500))
+
+    assert result["passes"] is True
+    assert stream.read == len(stream.pieces)
+
+
+def test_stream_json_batch_reads_on_when_an_entry_lacks_passes():
+    body = json.dumps({"results": [
+        {"index": 1, "passes": False, "reasons": ["pool"], "highlights": []},
+        {"index": 2, "reasons": [], "highlights": [], "passes": True},
+    ]})
+    agent, stream = _agent_streaming(body)
+
+    result = asyncio.run(agent._stream_json("prompt", max_tokens=800, stop_after=2, closer="}]}"))
+
+    assert [entry["passes"] for entry in result["results"]] == [False, True]
+    assert stream.read == len(stream.pieces)
+
+
+def test_quick_validation_reports_every_failure_dealbreakers_first():
+    agent = ReviewerAgent.__new__(ReviewerAgent)
+    agent.min_price, agent.max_price, agent.min_year = 200000, 350000, 1926
+    agent.avoid_cities = frozenset({"cleveland"})
+    prop = PropertyData(property_id="p1", city="Cleveland", price=400000, year_built=1900,
+                        property_type="Condo", has_pool=True)
+
+    result = agent._quick_validation(prop)
+
+    assert not result["passes"]
+    assert result["reasons"] == [
+        "Has a pool (dealbreaker)",
+        "Price $400,000 is above maximum $350,000",
+        "Property type is condo (not single-family)",
+        "Located in Cleveland (excluded area)",
+        "Over 100 years old",
+    ]
@@ -0,0 +1,28 @@
+import os
+import time
+
+from house_hunter.scraper import RealtorAPIScraper
+
+
+def test_reset_budget_prunes_expired_cache_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("RAPIDAPI_KEY", "test-key")
+    monkeypatch.setenv("HOUSE_HUNTER_API_CACHE_DIR", str(tmp_path))
+    scraper = RealtorAPIScraper()
+    scraper._cache_set("fresh", {"data": 1})
+    scraper._cache_set("stale", {"data": 2})
+    (tmp_path / "orphan.123.tmp").write_bytes(b"{")
+    expired = time.time() - max(scraper.list_cache_ttl, scraper.detail_cache_ttl) - 60
+    for name in ("stale.json", "orphan.123.tmp"):
+        os.utime(tmp_path / name, (expired, expired))
+
+    scraper.reset_budget()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["fresh.json"]
+    assert scraper._cache_get("fresh", scraper.list_cache_ttl) == {"data": 1}
+
+
+def test_prune_cache_without_a_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("RAPIDAPI_KEY", "test-key")
+    monkeypatch.setenv("HOUSE_HUNTER_API_CACHE_DIR", str(tmp_path / "missing"))
+
+    assert RealtorAPIScraper().prune_cache() == 0